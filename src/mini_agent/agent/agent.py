@@ -6,6 +6,7 @@ from typing import Callable, Optional
 from ..ai.types import AssistantMessage, Context
 from ..ai.providers.base import StreamOptions
 from ..ai.providers import get_provider
+from ..debug import get_event_logger
 from .types import AgentContext, AgentState, AgentEvent, AgentEventType, AgentTool
 from .loop import AgentLoop
 
@@ -178,9 +179,9 @@ Available tools:
 
 
 # Debug: patch prompt method
+_event_logger = get_event_logger("agent")
 _original_prompt = Agent.prompt
 async def _debug_prompt(self, text, max_iterations=20):
-    with open("/tmp/mini-agent-events.log", "a") as f:
-        f.write(f"[DEBUG AGENT] prompt called, handlers: {len(self._event_handlers)}\n")
+    _event_logger.debug("prompt called, handlers: %d", len(self._event_handlers))
     return await _original_prompt(self, text, max_iterations)
 Agent.prompt = _debug_prompt
@@ -6,11 +6,14 @@ from typing import AsyncIterator, Callable, Optional
 from ..ai.types import Context, AssistantMessage, ToolResultMessage
 from ..ai.event_stream import EventType
 from ..ai.providers.base import StreamOptions
+from ..debug import get_event_logger
 from .types import (
     AgentContext, AgentState, AgentEvent, AgentEventType,
     AgentTool, ToolExecution,
 )
 
+_event_logger = get_event_logger("loop")
+
 
 class AgentLoop:
     """
@@ -40,14 +43,12 @@ class AgentLoop:
 
     def emit(self, event: AgentEvent) -> None:
         """Emit an event to all handlers."""
-        with open("/tmp/mini-agent-events.log", "a") as f:
-            f.write(f"[DEBUG LOOP] Emitting: {event.type}\n")
+        _event_logger.debug("Emitting: %s", event.type)
         for handler in self._event_handlers:
             try:
                 handler(event)
             except Exception as e:
-                with open("/tmp/mini-agent-events.log", "a") as f:
-                    f.write(f"[DEBUG LOOP] Handler error: {e}\n")
+                _event_logger.debug("Handler error: %s", e)
 
     def abort(self) -> None:
         """Abort the current operation."""
@@ -126,8 +127,7 @@ class AgentLoop:
 
     async def _stream_response(self) -> AssistantMessage:
         """Stream a response from the LLM."""
-        with open("/tmp/mini-agent-events.log", "a") as f:
-            f.write(f"[DEBUG LOOP] Starting stream for model: {self.model}\n")
+        _event_logger.debug("Starting stream for model: %s", self.model)
 
         stream = await self.provider.stream(
             model=self.model,
@@ -138,21 +138,18 @@ class AgentLoop:
         current_text = ""
         current_thinking = ""
 
-        with open("/tmp/mini-agent-events.log", "a") as f:
-            f.write("[DEBUG LOOP] Stream created, iterating...\n")
+        _event_logger.debug("Stream created, iterating...")
 
         async for event in stream:
             if self._abort_flag:
                 break
 
-            with open("/tmp/mini-agent-events.log", "a") as f:
-                f.write(f"[DEBUG LOOP] Stream event: {event.type}\n")
+            _event_logger.debug("Stream event: %s", event.type)
 
             if event.type == EventType.TEXT_DELTA:
                 delta = event.data.delta if hasattr(event.data, 'delta') else str(event.data)
                 current_text += delta
-                with open("/tmp/mini-agent-events.log", "a") as f:
-                    f.write(f"[DEBUG LOOP] Text delta: {delta[:30]}...\n")
+                _event_logger.debug("Text delta: %.30s...", delta)
                 self.emit(AgentEvent(AgentEventType.STREAM_TEXT, {"delta": delta}))
 
             elif event.type == EventType.THINKING_DELTA:
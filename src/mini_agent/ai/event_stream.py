@@ -1,6 +1,7 @@
 """EventStream implementation for async streaming."""
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, AsyncIterator, Callable, Optional
@@ -79,7 +80,10 @@ class EventStream:
     """
 
     def __init__(self):
-        self._queue: asyncio.Queue = asyncio.Queue()
+        # Pending events, with a flag the consumer waits on when it runs dry;
+        # unlike asyncio.Queue this creates no future per event
+        self._buffer: deque[Event] = deque()
+        self._has_data = asyncio.Event()
         self._ended = False
         self._result: Optional[AssistantMessage] = None
         self._error: Optional[Exception] = None
@@ -89,7 +93,7 @@ class EventStream:
         """Push an event to the stream."""
         if self._ended:
             return
-        self._queue.put_nowait(event)
+        self._put(event)
         # Notify subscribers
         for sub in self._subscribers:
             try:
@@ -101,13 +105,18 @@ class EventStream:
         """End the stream with an optional final message."""
         self._result = message
         self._ended = True
-        self._queue.put_nowait(Event(EventType.DONE, message))
+        self._put(Event(EventType.DONE, message))
 
     def error(self, error: Exception) -> None:
         """End the stream with an error."""
         self._error = error
         self._ended = True
-        self._queue.put_nowait(Event(EventType.ERROR, str(error)))
+        self._put(Event(EventType.ERROR, str(error)))
+
+    def _put(self, event: Event) -> None:
+        """Buffer an event and wake the consumer."""
+        self._buffer.append(event)
+        self._has_data.set()
 
     def subscribe(self, callback: Callable[[Event], None]) -> None:
         """Subscribe to events."""
@@ -143,7 +152,10 @@ class EventStream:
             raise self._error
 
         try:
-            event = await self._queue.get()
+            while not self._buffer:
+                self._has_data.clear()
+                await self._has_data.wait()
+            event = self._buffer.popleft()
             if event.type == EventType.DONE:
                 raise StopAsyncIteration
             if event.type == EventType.ERROR:
@@ -171,8 +183,9 @@ class AssistantMessageEventStream(EventStream):
 
     def __init__(self):
         super().__init__()
-        self._text_buffers: dict[int, str] = {}
-        self._thinking_buffers: dict[int, str] = {}
+        # Deltas are collected as chunk lists and joined once in build_message()
+        self._text_buffers: dict[int, list[str]] = {}
+        self._thinking_buffers: dict[int, list[str]] = {}
         self._tool_call_buffers: dict[int, dict] = {}
         self._usage = Usage()
         self._stop_reason = StopReason.END_TURN
@@ -183,7 +196,7 @@ class AssistantMessageEventStream(EventStream):
 
     def push_text_delta(self, delta: str, index: int = 0) -> None:
         """Push text delta."""
-        self._text_buffers[index] = self._text_buffers.get(index, "") + delta
+        self._text_buffers.setdefault(index, []).append(delta)
         self.push(Event(EventType.TEXT_DELTA, TextEvent(index=index, delta=delta)))
 
     def push_text_end(self, index: int = 0) -> None:
@@ -196,7 +209,7 @@ class AssistantMessageEventStream(EventStream):
 
     def push_thinking_delta(self, delta: str, index: int = 0) -> None:
         """Push thinking delta."""
-        self._thinking_buffers[index] = self._thinking_buffers.get(index, "") + delta
+        self._thinking_buffers.setdefault(index, []).append(delta)
         self.push(Event(EventType.THINKING_DELTA, ThinkingEvent(index=index, delta=delta)))
 
     def push_thinking_end(self, index: int = 0) -> None:
@@ -205,7 +218,7 @@ class AssistantMessageEventStream(EventStream):
 
     def push_toolcall_start(self, index: int = 0, id: str = "", name: str = "") -> None:
         """Signal start of tool call."""
-        self._tool_call_buffers[index] = {"id": id, "name": name, "arguments": ""}
+        self._tool_call_buffers[index] = {"id": id, "name": name, "arguments": []}
         self.push(Event(EventType.TOOLCALL_START, ToolCallEvent(
             index=index, id=id, name=name
         )))
@@ -221,7 +234,7 @@ class AssistantMessageEventStream(EventStream):
     def push_toolcall_arguments_delta(self, delta: str, index: int = 0) -> None:
         """Push tool arguments delta."""
         if index in self._tool_call_buffers:
-            self._tool_call_buffers[index]["arguments"] += delta
+            self._tool_call_buffers[index]["arguments"].append(delta)
         self.push(Event(EventType.TOOLCALL_DELTA, ToolCallEvent(
             index=index, arguments_delta=delta
         )))
@@ -247,16 +260,17 @@ class AssistantMessageEventStream(EventStream):
 
         # Sort by index and add content
         for idx in sorted(self._text_buffers.keys()):
-            content.append(TextContent(text=self._text_buffers[idx]))
+            content.append(TextContent(text="".join(self._text_buffers[idx])))
 
         for idx in sorted(self._thinking_buffers.keys()):
-            content.append(ThinkingContent(text=self._thinking_buffers[idx]))
+            content.append(ThinkingContent(text="".join(self._thinking_buffers[idx])))
 
         for idx in sorted(self._tool_call_buffers.keys()):
             tc_data = self._tool_call_buffers[idx]
+            arguments = "".join(tc_data["arguments"])
             import json
             try:
-                args = json.loads(tc_data["arguments"]) if tc_data["arguments"] else {}
+                args = json.loads(arguments) if arguments else {}
             except json.JSONDecodeError:
                 args = {}
             content.append(ToolCall(
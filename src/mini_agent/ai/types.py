@@ -2,9 +2,30 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Optional, Union
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(text: str) -> Any:
+    """Parse a JSON string, with orjson when available."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class StopReason(Enum):
     """Reason for stopping generation."""
@@ -15,7 +36,11 @@ class StopReason(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Plain dict lookup, cheaper than calling the Enum for every deserialized message
+_STOP_REASON_BY_VALUE = {reason.value: reason for reason in StopReason}
+
+
+@dataclass(slots=True)
 class TextContent:
     """Text content in a message."""
     type: str = "text"
@@ -29,7 +54,7 @@ class TextContent:
         return cls(type=data.get("type", "text"), text=data.get("text", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingContent:
     """Thinking/reasoning content in a message."""
     type: str = "thinking"
@@ -51,7 +76,7 @@ class ThinkingContent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageContent:
     """Image content in a message."""
     type: str = "image"
@@ -80,7 +105,7 @@ class ImageContent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Tool call in a message."""
     id: str
@@ -93,7 +118,7 @@ class ToolCall:
             "type": "function",
             "function": {
                 "name": self.name,
-                "arguments": json.dumps(self.arguments) if self.arguments else "{}",
+                "arguments": _dumps(self.arguments) if self.arguments else "{}",
             }
         }
 
@@ -103,7 +128,7 @@ class ToolCall:
         args = func.get("arguments", "{}")
         if isinstance(args, str):
             try:
-                args = json.loads(args)
+                args = _loads(args)
             except json.JSONDecodeError:
                 args = {}
         return cls(
@@ -140,7 +165,7 @@ class Tool:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     """Token usage information."""
     input_tokens: int = 0
@@ -166,12 +191,15 @@ class Usage:
         )
 
     def __add__(self, other: "Usage") -> "Usage":
-        return Usage(
-            input_tokens=self.input_tokens + other.input_tokens,
-            output_tokens=self.output_tokens + other.output_tokens,
-            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
-            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
-        )
+        a = _USAGE_FIELDS(self)
+        b = _USAGE_FIELDS(other)
+        return Usage(a[0] + b[0], a[1] + b[1], a[2] + b[2], a[3] + b[3])
+
+
+# Reads all Usage counters in one call, in field order
+_USAGE_FIELDS = attrgetter(
+    "input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens"
+)
 
 
 ContentBlock = Union[TextContent, ThinkingContent, ImageContent, ToolCall]
@@ -235,12 +263,13 @@ class AssistantMessage:
             elif block.get("function"):  # tool call
                 content.append(ToolCall.from_dict(block))
 
-        stop_reason = StopReason.END_TURN
-        if data.get("stop_reason"):
-            try:
-                stop_reason = StopReason(data["stop_reason"])
-            except ValueError:
-                pass
+        stop_reason = data.get("stop_reason")
+        # StopReason members are kept as they are; unknown strings and any
+        # other values (including unhashable ones) fall back to END_TURN
+        if isinstance(stop_reason, str):
+            stop_reason = _STOP_REASON_BY_VALUE.get(stop_reason, StopReason.END_TURN)
+        elif not isinstance(stop_reason, StopReason):
+            stop_reason = StopReason.END_TURN
 
         return cls(
             role="assistant",
@@ -252,11 +281,7 @@ class AssistantMessage:
     @property
     def text(self) -> str:
         """Get all text content."""
-        texts = []
-        for block in self.content:
-            if isinstance(block, TextContent):
-                texts.append(block.text)
-        return "".join(texts)
+        return "".join([block.text for block in self.content if isinstance(block, TextContent)])
 
     @property
     def tool_calls(self) -> list[ToolCall]:
@@ -1,6 +1,7 @@
 """CLI entry point for mini-agent."""
 
 import asyncio
+import functools
 import os
 import sys
 from pathlib import Path
@@ -81,18 +82,26 @@ MODEL_PROVIDERS = {
 }
 
 
+# Provider for model names not in MODEL_PROVIDERS, by lowercase prefix
+_PREFIX_RULES = (
+    (("gpt", "o1"), "openai"),
+    (("claude", "glm"), "anthropic"),
+)
+
+
+@functools.lru_cache(maxsize=256)
 def detect_provider(model: str) -> str:
-    """Detect provider from model name."""
-    # Check exact match first
-    if model in MODEL_PROVIDERS:
-        return MODEL_PROVIDERS[model]
+    """Detect provider from model name. Results are memoized per name."""
+    # Mapping keys are lowercase, so one lookup covers any casing
+    model_lower = model.lower()
+    provider = MODEL_PROVIDERS.get(model_lower)
+    if provider is not None:
+        return provider
 
     # Check prefix match
-    model_lower = model.lower()
-    if model_lower.startswith("gpt") or model_lower.startswith("o1"):
-        return "openai"
-    if model_lower.startswith("claude") or model_lower.startswith("glm"):
-        return "anthropic"
+    for prefixes, provider in _PREFIX_RULES:
+        if model_lower.startswith(prefixes):
+            return provider
 
     # Default to anthropic (supports more custom endpoints)
     return "anthropic"
@@ -247,7 +256,7 @@ def _list_sessions() -> None:
 
     for session in sessions:
         console.print(f"  [cyan]{session.id}[/] - {session.name}")
-        console.print(f"    Model: {session.model}, Messages: {len(session.messages)}")
+        console.print(f"    Model: {session.model}, Messages: {session.message_count}")
         console.print(f"    Updated: {session.updated_at}")
         console.print()
 
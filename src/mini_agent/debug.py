@@ -0,0 +1,38 @@
+"""Debug logging of agent events."""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Agent events are logged for debugging when MINI_AGENT_DEBUG is set.
+# Records go through a queue so the file is written from a background
+# thread instead of being opened on every streamed token.
+EVENT_LOG_PATH = "/tmp/mini-agent-events.log"
+
+_event_logger = logging.getLogger("mini_agent.events")
+_event_logger.propagate = False
+
+if os.getenv("MINI_AGENT_DEBUG"):
+    _event_log_queue: queue.Queue = queue.Queue(-1)
+    _event_log_handler = logging.FileHandler(EVENT_LOG_PATH, delay=True)
+    _event_log_handler.setFormatter(logging.Formatter("[DEBUG %(name)s] %(message)s"))
+    _event_log_listener = QueueListener(_event_log_queue, _event_log_handler)
+    _event_log_listener.start()
+    atexit.register(_event_log_listener.stop)
+    _event_logger.addHandler(QueueHandler(_event_log_queue))
+    _event_logger.setLevel(logging.DEBUG)
+
+
+def get_event_logger(component: str) -> logging.Logger:
+    """
+    Get the debug event logger for a component.
+
+    Args:
+        component: Short component name, e.g. "loop" or "tui"
+
+    Returns:
+        A child of the mini_agent.events logger, sharing its queued file handler
+    """
+    return _event_logger.getChild(component)
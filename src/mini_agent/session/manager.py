@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from .storage import Session, SessionStorage
+from .storage import Session, SessionStorage, SessionSummary
 
 
 class SessionManager:
@@ -54,7 +54,7 @@ class SessionManager:
             self.current_session = None
         return self.storage.delete(session_id)
 
-    def list_sessions(self) -> list[Session]:
+    def list_sessions(self) -> list[SessionSummary]:
         """List all saved sessions."""
         return self.storage.list_sessions()
 
@@ -2,17 +2,39 @@
 
 import json
 import os
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
-import uuid
+import secrets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(data: dict) -> bytes:
+    """Serialize session data as indented JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse session data written by _dumps()."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True, kw_only=True)
 class Session:
     """Represents a conversation session."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    # 8 random hex digits, as the first group of a uuid4 string would give
+    id: str = field(default_factory=lambda: secrets.token_hex(4))
     name: str = ""
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -22,6 +44,14 @@ class Session:
     messages: list = field(default_factory=list)
     tools: list = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Every session repeats one of a handful of model and provider names.
+        # Saved files may hold null for either, which is kept as is.
+        if isinstance(self.model, str):
+            self.model = sys.intern(self.model)
+        if isinstance(self.provider, str):
+            self.provider = sys.intern(self.provider)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -31,6 +61,7 @@ class Session:
             "model": self.model,
             "provider": self.provider,
             "working_directory": self.working_directory,
+            "message_count": len(self.messages),
             "messages": self.messages,
             "tools": self.tools,
         }
@@ -38,7 +69,7 @@ class Session:
     @classmethod
     def from_dict(cls, data: dict) -> "Session":
         return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
+            id=data["id"] if "id" in data else secrets.token_hex(4),
             name=data.get("name", ""),
             created_at=data.get("created_at", datetime.now().isoformat()),
             updated_at=data.get("updated_at", datetime.now().isoformat()),
@@ -50,6 +81,41 @@ class Session:
         )
 
 
+@dataclass(slots=True, kw_only=True)
+class SessionSummary:
+    """Session metadata shown when listing sessions, without the messages."""
+    id: str
+    name: str
+    created_at: str
+    updated_at: str
+    model: str
+    provider: str
+    working_directory: str
+    message_count: int
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionSummary":
+        session = Session.from_dict({**data, "messages": []})
+        return cls(
+            id=session.id,
+            name=session.name,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            model=session.model,
+            provider=session.provider,
+            working_directory=session.working_directory,
+            message_count=data["message_count"],
+        )
+
+
+# Session files list the metadata before the messages, so listing only
+# needs the start of each file, up to this key. Whitespace is optional so
+# that indented and compact JSON both match; inside a string value the
+# quote would be escaped, so only a real key follows a comma like this.
+_MESSAGES_KEY = re.compile(rb',\s*"messages"\s*:')
+_SUMMARY_READ_SIZE = 4096
+
+
 class SessionStorage:
     """
     Handles persistence of sessions to disk.
@@ -78,8 +144,7 @@ class SessionStorage:
         session.updated_at = datetime.now().isoformat()
         path = self._get_session_path(session.id)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(session.to_dict(), f, indent=2)
+        path.write_bytes(_dumps(session.to_dict()))
 
     def load(self, session_id: str) -> Optional[Session]:
         """Load a session from disk."""
@@ -89,9 +154,7 @@ class SessionStorage:
             return None
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return Session.from_dict(data)
+            return Session.from_dict(_loads(path.read_bytes()))
         except Exception:
             return None
 
@@ -104,22 +167,43 @@ class SessionStorage:
             return True
         return False
 
-    def list_sessions(self) -> list[Session]:
-        """List all saved sessions."""
-        sessions = []
+    def list_sessions(self) -> list[SessionSummary]:
+        """List all saved sessions, most recently updated first."""
+        # Saving stamps updated_at just before writing, so the file
+        # modification times give the same order without parsing anything
+        entries = []
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    entries.append((entry.stat().st_mtime, entry.path))
+        entries.sort(reverse=True)
 
-        for path in self.base_dir.glob("*.json"):
+        sessions = []
+        for _, path in entries:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                sessions.append(Session.from_dict(data))
+                sessions.append(self._load_summary(path))
             except Exception:
                 continue
-
-        # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
         return sessions
 
+    def _load_summary(self, path: str) -> SessionSummary:
+        """Read a session's metadata, parsing only the start of the file."""
+        with open(path, 'rb') as f:
+            head = f.read(_SUMMARY_READ_SIZE)
+            key = _MESSAGES_KEY.search(head)
+            if key is not None:
+                # Drop the comma before the key and close the object
+                try:
+                    data = _loads(head[:key.start()] + b'}')
+                except ValueError:
+                    data = {}
+                if "message_count" in data:
+                    return SessionSummary.from_dict(data)
+            # Unusually long metadata, or a file saved without the count
+            data = _loads(head + f.read())
+        data["message_count"] = len(data.get("messages", []))
+        return SessionSummary.from_dict(data)
+
     def exists(self, session_id: str) -> bool:
         """Check if a session exists."""
         return self._get_session_path(session_id).exists()
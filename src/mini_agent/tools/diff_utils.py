@@ -1,9 +1,24 @@
 """Diff generation utilities."""
 
+import bisect
 import difflib
+import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import Optional
 
+# Above this many line pairs, SequenceMatcher is only run between lines that
+# occur once in each file; its longest-match search rescans the whole range
+# for every matching block, which is quadratic for scattered edits
+_ANCHOR_THRESHOLD = 100_000
+# Changed regions larger than this many characters, left over after the
+# common prefix and suffix and the unique-line anchors are matched, are
+# shown as a single replacement without matching lines inside them,
+# bounding the cost of huge rewrites to the size of the input
+_WHOLE_REPLACE_THRESHOLD = 256 * 1024
+# Line boundaries that str.splitlines() recognises besides '\n'
+_OTHER_LINE_BREAKS = re.compile('[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+
 
 @dataclass
 class DiffResult:
@@ -30,22 +45,41 @@ def generate_diff_string(
     Returns:
         DiffResult with the diff string and first changed line number
     """
+    # Identical content needs no diff; compare lengths first so that
+    # different-sized content is rejected without scanning it
+    if len(old_content) == len(new_content) and old_content == new_content:
+        return DiffResult(diff="", first_changed_line=None)
+
     old_lines = old_content.splitlines(keepends=True)
     new_lines = new_content.splitlines(keepends=True)
 
+    # Like GNU diff, only run the matcher on the window between the common
+    # leading and trailing lines, which is usually small for an edit
+    prefix, suffix = _common_affix_lengths(old_lines, new_lines)
+    old_window = old_lines[prefix:len(old_lines) - suffix]
+    new_window = new_lines[prefix:len(new_lines) - suffix]
+    opcodes: list[tuple[str, int, int, int, int]] = []
+    _append_opcode(opcodes, 'equal', 0, prefix, 0, prefix)
+    _match_window(old_window, new_window, prefix, prefix, opcodes)
+    _append_opcode(
+        opcodes,
+        'equal',
+        len(old_lines) - suffix,
+        len(old_lines),
+        len(new_lines) - suffix,
+        len(new_lines),
+    )
+
     # Generate unified diff
-    diff = difflib.unified_diff(
+    diff_text = _format_unified_diff(
+        _group_opcodes(opcodes, context_lines),
         old_lines,
         new_lines,
-        fromfile=f"a/{filename}",
-        tofile=f"b/{filename}",
-        n=context_lines,
+        filename,
     )
 
-    diff_text = ''.join(diff)
-
     # Find the first changed line number
-    first_changed_line = _find_first_changed_line(old_content, new_content)
+    first_changed_line = _find_first_changed_line(old_lines, new_lines, prefix)
 
     return DiffResult(
         diff=diff_text,
@@ -53,34 +87,246 @@ def generate_diff_string(
     )
 
 
-def _find_first_changed_line(old_content: str, new_content: str) -> Optional[int]:
+def _common_affix_lengths(old_lines: list[str], new_lines: list[str]) -> tuple[int, int]:
     """
-    Find the 1-indexed line number of the first change.
+    Count the lines shared at the start and, past those, at the end of both lists.
+
+    Returns:
+        Tuple of (common prefix length, common suffix length)
+    """
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _match_window(
+    old_lines: list[str],
+    new_lines: list[str],
+    old_offset: int,
+    new_offset: int,
+    opcodes: list[tuple[str, int, int, int, int]],
+) -> None:
+    """
+    Append opcodes turning old_lines into new_lines, shifted by the given offsets.
+
+    Large windows are first split at lines that occur exactly once on each
+    side and appear in the same order (as in patience diff); each gap between
+    those anchors is then matched on its own, or shown as a single
+    replacement if it is larger than _WHOLE_REPLACE_THRESHOLD.
+    """
+    if not old_lines and not new_lines:
+        return
+
+    anchors = []
+    if len(old_lines) * len(new_lines) > _ANCHOR_THRESHOLD:
+        anchors = _unique_anchors(old_lines, new_lines)
+
+    if not anchors:
+        if old_lines and new_lines and max(
+            sum(map(len, old_lines)), sum(map(len, new_lines))
+        ) > _WHOLE_REPLACE_THRESHOLD:
+            _append_opcode(
+                opcodes,
+                'replace',
+                old_offset,
+                old_offset + len(old_lines),
+                new_offset,
+                new_offset + len(new_lines),
+            )
+            return
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            _append_opcode(
+                opcodes, tag, i1 + old_offset, i2 + old_offset, j1 + new_offset, j2 + new_offset
+            )
+        return
+
+    i = j = 0
+    for anchor_i, anchor_j in anchors:
+        if i < anchor_i or j < anchor_j:
+            _match_window(
+                old_lines[i:anchor_i], new_lines[j:anchor_j], old_offset + i, new_offset + j, opcodes
+            )
+        i, j = anchor_i + 1, anchor_j + 1
+        _append_opcode(
+            opcodes, 'equal', old_offset + anchor_i, old_offset + i, new_offset + anchor_j, new_offset + j
+        )
+    _match_window(old_lines[i:], new_lines[j:], old_offset + i, new_offset + j, opcodes)
+
+
+def _unique_anchors(old_lines: list[str], new_lines: list[str]) -> list[tuple[int, int]]:
+    """
+    Pair up lines that occur exactly once in each list.
+
+    Returns:
+        The longest run of (old index, new index) pairs that increases on
+        both sides, so the pairs can all be matched at once
+    """
+    unique = {line for line, count in Counter(old_lines).items() if count == 1}
+    unique.intersection_update(
+        line for line, count in Counter(new_lines).items() if count == 1
+    )
+    new_index = dict(zip(new_lines, range(len(new_lines))))
+    pairs = [(i, new_index[line]) for i, line in enumerate(old_lines) if line in unique]
+
+    # Unique lines usually keep their order, in which case all pairs are used
+    new_indices = [j for _, j in pairs]
+    if new_indices == sorted(new_indices):
+        return pairs
+
+    # Longest increasing subsequence of new indices (patience sorting)
+    tails: list[int] = []
+    tail_pairs: list[int] = []
+    previous = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, j)
+        if pos:
+            previous[k] = tail_pairs[pos - 1]
+        if pos == len(tails):
+            tails.append(j)
+            tail_pairs.append(k)
+        else:
+            tails[pos] = j
+            tail_pairs[pos] = k
+
+    anchors = []
+    k = tail_pairs[-1] if tail_pairs else -1
+    while k != -1:
+        anchors.append(pairs[k])
+        k = previous[k]
+    anchors.reverse()
+    return anchors
+
+
+def _append_opcode(
+    opcodes: list[tuple[str, int, int, int, int]],
+    tag: str,
+    i1: int,
+    i2: int,
+    j1: int,
+    j2: int,
+) -> None:
+    """Append an opcode, skipping empty ranges and merging adjacent equal blocks."""
+    if i1 == i2 and j1 == j2:
+        return
+    if tag == 'equal' and opcodes and opcodes[-1][0] == 'equal':
+        opcodes[-1] = ('equal', opcodes[-1][1], i2, opcodes[-1][3], j2)
+        return
+    opcodes.append((tag, i1, i2, j1, j2))
+
+
+def _group_opcodes(opcodes: list[tuple[str, int, int, int, int]], n: int):
+    """
+    Split opcodes into hunks with up to n lines of context.
+
+    Same as SequenceMatcher.get_grouped_opcodes(), for opcodes that were
+    not produced by a single matcher.
+    """
+    codes = opcodes or [('equal', 0, 1, 0, 1)]
+    # Fixup leading and trailing groups if they show no changes
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        # End the current group whenever there is a large range with no changes
+        if tag == 'equal' and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+
+def _format_unified_diff(
+    groups,
+    old_lines: list[str],
+    new_lines: list[str],
+    filename: str,
+) -> str:
+    """
+    Render grouped opcodes as a unified diff, as difflib.unified_diff does.
 
     Args:
-        old_content: Original content
-        new_content: New content
+        groups: Hunks of opcodes, as produced by _group_opcodes()
+        old_lines: Original lines, with line endings
+        new_lines: New lines, with line endings
+        filename: Name to use in diff header
 
     Returns:
-        1-indexed line number of first change, or None if no changes
+        The unified diff, or an empty string if there are no changes
+    """
+    out: list[str] = []
+    for group in groups:
+        if not out:
+            out.append(f"--- a/{filename}\n+++ b/{filename}\n")
+
+        first, last = group[0], group[-1]
+        out.append(
+            f"@@ -{_format_range(first[1], last[2])} "
+            f"+{_format_range(first[3], last[4])} @@\n"
+        )
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                out.extend(' ' + line for line in old_lines[i1:i2])
+                continue
+            if tag != 'insert':
+                out.extend('-' + line for line in old_lines[i1:i2])
+            if tag != 'delete':
+                out.extend('+' + line for line in new_lines[j1:j2])
+
+    return ''.join(out)
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a 0-indexed line range as a unified diff hunk range."""
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    if not length:
+        # Empty ranges begin at the line just before the range
+        return f"{start},0"
+    return f"{start + 1},{length}"
+
+
+def _find_first_changed_line(
+    old_lines: list[str],
+    new_lines: list[str],
+    prefix: int,
+) -> Optional[int]:
     """
-    old_lines = old_content.splitlines()
-    new_lines = new_content.splitlines()
+    Find the 1-indexed line number of the first change.
 
-    # Use SequenceMatcher to find the first change
-    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    Lines are compared without their line endings, so a change of line
+    ending alone does not count.
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag != 'equal':
-            # Return the line number in the original file (1-indexed)
-            # For 'replace' and 'delete', use old line position
-            # For 'insert', use the position before which insertion happens
-            if tag in ('replace', 'delete'):
-                return i1 + 1
-            elif tag == 'insert':
-                return i1 + 1 if i1 > 0 else 1
+    Args:
+        old_lines: Original lines, with line endings
+        new_lines: New lines, with line endings
+        prefix: Number of leading lines known to be identical
 
-    return None
+    Returns:
+        1-indexed line number of first change, or None if no changes
+    """
+    limit = min(len(old_lines), len(new_lines))
+    # Each line has at most one line ending, which splitlines() drops
+    while prefix < limit and old_lines[prefix].splitlines() == new_lines[prefix].splitlines():
+        prefix += 1
+    if prefix == len(old_lines) == len(new_lines):
+        return None
+    return prefix + 1
 
 
 def format_diff_for_output(diff_result: DiffResult, max_lines: int = 50) -> str:
@@ -94,21 +340,45 @@ def format_diff_for_output(diff_result: DiffResult, max_lines: int = 50) -> str:
     Returns:
         Formatted diff string for display
     """
-    if not diff_result.diff:
+    diff = diff_result.diff
+    if not diff:
         return "No changes"
 
-    lines = diff_result.diff.splitlines(keepends=True)
+    # Lines are counted as str.splitlines() does. When '\n' is the only
+    # line boundary in the diff, the kept lines are found without splitting
+    # it; other diffs, and limits too small to keep a tail, are split.
+    if max_lines > 2 and _OTHER_LINE_BREAKS.search(diff) is None:
+        total_lines = diff.count('\n') + (not diff.endswith('\n'))
 
-    if len(lines) <= max_lines:
-        output = diff_result.diff
+        if total_lines <= max_lines:
+            output = diff
+        else:
+            # Truncate to max_lines, keeping the two header lines and the tail
+            tail_lines = max_lines - 2
+
+            header_end = diff.find('\n', diff.find('\n') + 1) + 1
+            tail_start = len(diff) - diff.endswith('\n')
+            for _ in range(tail_lines):
+                tail_start = diff.rfind('\n', 0, tail_start)
+
+            output = ''.join((
+                diff[:header_end],
+                f"... (truncated {total_lines - max_lines} lines)\n",
+                diff[tail_start + 1:],
+            ))
     else:
-        # Truncate to max_lines, keeping header and tail
-        header_lines = min(2, len(lines))  # Keep diff header
-        tail_lines = max_lines - header_lines
+        lines = diff.splitlines(keepends=True)
+
+        if len(lines) <= max_lines:
+            output = diff
+        else:
+            # Truncate to max_lines, keeping header and tail
+            header_lines = min(2, len(lines))  # Keep diff header
+            tail_lines = max_lines - header_lines
 
-        output = ''.join(lines[:header_lines])
-        output += f"... (truncated {len(lines) - max_lines} lines)\n"
-        output += ''.join(lines[-tail_lines:])
+            output = ''.join(lines[:header_lines])
+            output += f"... (truncated {len(lines) - max_lines} lines)\n"
+            output += ''.join(lines[-tail_lines:])
 
     if diff_result.first_changed_line is not None:
         output += f"\nFirst change at line {diff_result.first_changed_line}"
@@ -125,20 +125,19 @@ class EditTool(BaseTool):
             )
             replacement_count = 1
 
-        # Restore line endings
-        new_content = restore_line_endings(new_content, line_ending)
+        # Restore line endings and the BOM
+        new_content = bom + restore_line_endings(new_content, line_ending)
 
-        # Write back with BOM preserved
+        # Write back the encoded bytes, as they were read
         try:
-            with open(path, 'w', encoding='utf-8', newline='') as f:
-                f.write(bom + new_content)
+            path.write_bytes(new_content.encode('utf-8'))
         except Exception as e:
             return f"Error writing file: {e}"
 
         # Generate diff
         diff_result = generate_diff_string(
             original_content,
-            bom + new_content,
+            new_content,
             filename=path.name
         )
 
@@ -200,11 +199,14 @@ class EditTool(BaseTool):
         match = fuzzy_find_text(content, old_string)
 
         if match.found:
-            return (
-                content[:match.index] +
-                new_string +
-                content[match.index + match.match_length:]
-            )
+            if not match.used_fuzzy_match:
+                # An exact match is spliced in with a single copy of the content
+                return content.replace(old_string, new_string, 1)
+            return ''.join((
+                content[:match.index],
+                new_string,
+                content[match.index + match.match_length:],
+            ))
 
         return content
 
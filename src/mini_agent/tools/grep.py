@@ -1,16 +1,63 @@
 """Grep tool implementation."""
 
 import asyncio
+import functools
 import json
+import os
+import re
 import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 from .base import BaseTool
 from .registry import register_tool
 from .truncate import truncate_tail, format_truncation_notice
 
+# Shared decoder for ripgrep's JSON Lines output
+_JSON_DECODER = json.JSONDecoder()
+# ripgrep always serializes the event type first, so non-match events
+# (begin/end/context/summary) can be skipped without decoding them
+_EVENT_PREFIX = '{"type":"'
+_MATCH_PREFIX = '{"type":"match"'
+
+# Maximum number of files read concurrently by the Python fallback
+_FALLBACK_CONCURRENCY = (os.cpu_count() or 1) * 4
+# Default result limit for the Python fallback
+_FALLBACK_MAX_RESULTS = 100
+
+if re2 is not None:
+    # Unsupported syntax is expected (we fall back to re), so don't log it
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str, case_insensitive: bool = False):
+    """
+    Compile a search pattern for the Python fallback.
+
+    Compiled patterns are cached, as agents often repeat the same search
+    across tool calls.
+
+    Uses RE2 when the optional google-re2 package is installed, since its
+    matching time is linear in the input and user-supplied patterns like
+    ``(a+)+$`` cannot hang the agent. Patterns RE2 does not support
+    (backreferences, look-around) fall back to the stdlib engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile("(?i)" + pattern if case_insensitive else pattern, _RE2_OPTIONS)
+        except re2.error:
+            pass
+
+    return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+
 
 @register_tool
 class GrepTool(BaseTool):
@@ -85,7 +132,7 @@ class GrepTool(BaseTool):
         # Check if rg (ripgrep) is available
         rg_path = shutil.which("rg")
         if not rg_path:
-            return self._fallback_grep(arguments)
+            return await self._fallback_grep(arguments)
 
         # Build command
         cmd = [rg_path, "--json"]  # JSON output for easy parsing
@@ -140,9 +187,11 @@ class GrepTool(BaseTool):
         for line in json_output.strip().split('\n'):
             if not line:
                 continue
+            if line.startswith(_EVENT_PREFIX) and not line.startswith(_MATCH_PREFIX):
+                continue
 
             try:
-                data = json.loads(line)
+                data = _JSON_DECODER.decode(line)
                 if data.get("type") == "match":
                     match_data = data.get("data", {})
                     path = match_data.get("path", {}).get("text", "")
@@ -164,42 +213,64 @@ class GrepTool(BaseTool):
 
     async def _fallback_grep(self, arguments: dict) -> str:
         """Fallback using Python's grep when ripgrep is not available."""
-        import re
-        from pathlib import Path
-
         pattern = arguments.get("pattern")
         path = Path(arguments.get("path", "."))
+        glob_pattern = arguments.get("glob")
         case_insensitive = arguments.get("case_insensitive", False)
-
-        flags = re.MULTILINE
-        if case_insensitive:
-            flags |= re.IGNORECASE
+        max_results = arguments.get("head_limit") or _FALLBACK_MAX_RESULTS
 
         try:
-            regex = re.compile(pattern, flags)
+            regex = _compile_pattern(pattern, case_insensitive)
         except re.error as e:
             return f"Error: Invalid regex pattern: {e}"
 
-        results = []
-
-        def search_file(file_path: Path):
+        def search_file(file_path: Path) -> list[str]:
+            matches = []
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    for i, line in enumerate(f, 1):
-                        if regex.search(line):
-                            results.append(f"{file_path}:{i}:\t{line.rstrip()}")
+                data = file_path.read_text(encoding='utf-8', errors='replace')
             except Exception:
-                pass
+                return matches
+            if not data:
+                return matches
+
+            # Match each line on its own, like ripgrep, so a match cannot run
+            # across line boundaries; split() leaves an empty final entry when
+            # the file ends with a newline, which is not a line of its own
+            lines = data.split('\n')
+            if lines[-1] == '':
+                lines.pop()
+            search = regex.search
+            for line_number, line in enumerate(lines, 1):
+                if search(line):
+                    matches.append(f"{file_path}:{line_number}:\t{line.rstrip()}")
+            return matches
 
         if path.is_file():
-            search_file(path)
+            files = [path]
         else:
-            for file_path in path.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    search_file(file_path)
+            files = [
+                file_path for file_path in path.rglob(glob_pattern or "*")
+                if file_path.is_file() and not file_path.name.startswith('.')
+            ]
+
+        # Read files in worker threads so disk I/O overlaps across files
+        semaphore = asyncio.Semaphore(_FALLBACK_CONCURRENCY)
+        found = 0
+
+        async def search(file_path: Path) -> list[str]:
+            nonlocal found
+            async with semaphore:
+                if found >= max_results:
+                    return []
+                matches = await asyncio.to_thread(search_file, file_path)
+                found += len(matches)
+                return matches
+
+        per_file = await asyncio.gather(*(search(file_path) for file_path in files))
+        results = [match for matches in per_file for match in matches]
 
         if not results:
             return "No matches found"
 
-        output = '\n'.join(results[:100])  # Limit results
+        output = '\n'.join(results[:max_results])  # Limit results
         return output
@@ -1,7 +1,10 @@
 """Read tool implementation."""
 
 import base64
+import itertools
+import mmap
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +14,52 @@ from .base import BaseTool
 from .registry import register_tool
 from .truncate import truncate_tail, format_truncation_notice
 
+# Files larger than this are memory-mapped and only the requested window is decoded
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+# Chunk size used when skipping to and counting lines with bytes.count()
+_COUNT_CHUNK_SIZE = 1024 * 1024
+# Line terminators recognised by universal newlines mode, which the
+# small-file path reads with
+_LINE_END = re.compile(rb'\r\n?|\n')
+
+
+def _skip_lines(mm: mmap.mmap, pos: int, n: int) -> tuple[int, int]:
+    """
+    Advance pos past up to n line terminators (\r\n, \r or \n).
+
+    Whole chunks are counted with bytes.count(), and only the chunk holding
+    the n-th terminator is scanned match by match, so skipping stays in C.
+
+    Returns:
+        Tuple of (offset after the last terminator skipped, or the end of
+        the file if there are fewer than n, number of terminators skipped)
+    """
+    size = len(mm)
+    skipped = 0
+    while skipped < n and pos < size:
+        chunk_end = min(pos + _COUNT_CHUNK_SIZE, size)
+        # Never split a \r\n pair between two chunks
+        if mm[chunk_end - 1] == ord('\r') and chunk_end < size:
+            chunk_end += 1
+        chunk = mm[pos:chunk_end]
+        count = chunk.count(b'\n')
+        if b'\r' in chunk:
+            count += chunk.count(b'\r') - chunk.count(b'\r\n')
+        if skipped + count >= n:
+            line_end = next(itertools.islice(_LINE_END.finditer(chunk), n - skipped - 1, None))
+            return pos + line_end.end(), n
+        skipped += count
+        pos = chunk_end
+    return pos, skipped
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split text into lines without line endings, like readlines() minus the newlines."""
+    lines = text.split('\n')
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
 
 @register_tool
 class ReadTool(BaseTool):
@@ -76,35 +125,46 @@ class ReadTool(BaseTool):
         if mime_type and mime_type.startswith("image/"):
             return await self._read_image(path, mime_type)
 
+        # Apply offset (1-based to 0-based)
+        start = max(0, offset - 1)
+
+        # Large files: map the file and decode only the requested lines
+        if path.stat().st_size > _MMAP_THRESHOLD:
+            try:
+                selected_lines, total_lines = self._read_lines_mmap(path, start, limit)
+            except Exception as e:
+                return f"Error reading file: {e}"
+            end = min(total_lines, start + limit)
+            return self._format_lines(selected_lines, start, end, total_lines)
+
         # Read text file
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                lines = _split_lines(f.read())
         except UnicodeDecodeError:
             # Try with a different encoding or return binary info
             try:
                 with open(path, 'r', encoding='latin-1') as f:
-                    lines = f.readlines()
+                    lines = _split_lines(f.read())
             except Exception as e:
                 return f"Error: Could not read file as text: {e}"
         except Exception as e:
             return f"Error reading file: {e}"
 
         total_lines = len(lines)
-
-        # Apply offset (1-based to 0-based)
-        start = max(0, offset - 1)
         end = min(total_lines, start + limit)
         selected_lines = lines[start:end]
 
-        # Format with line numbers
-        formatted_lines = []
-        for i, line in enumerate(selected_lines, start=start + 1):
-            # Remove trailing newline for display, we'll add it back
-            line_content = line.rstrip('\n')
-            formatted_lines.append(f"{i:6}\t{line_content}")
+        return self._format_lines(selected_lines, start, end, total_lines)
 
-        content = '\n'.join(formatted_lines)
+    def _format_lines(
+        self, selected_lines: list[str], start: int, end: int, total_lines: int
+    ) -> str:
+        """Format selected lines with line numbers, truncation and continuation hints."""
+        # Format with line numbers
+        content = '\n'.join(
+            f"{i:6}\t{line}" for i, line in enumerate(selected_lines, start=start + 1)
+        )
 
         # Apply truncation if needed
         result = truncate_tail(content, max_lines=2000, max_bytes=256000)
@@ -120,6 +180,36 @@ class ReadTool(BaseTool):
 
         return output
 
+    def _read_lines_mmap(
+        self, path: Path, start: int, limit: int
+    ) -> tuple[list[str], int]:
+        """
+        Read up to limit lines starting at line start (0-based) from a large file.
+
+        The file is memory-mapped so only the requested window is copied and
+        decoded; lines after the window are counted in fixed-size chunks.
+
+        Returns:
+            Tuple of (lines without line endings, total line count)
+        """
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            window_start, skipped = _skip_lines(mm, 0, start)
+            window_end, taken = _skip_lines(mm, window_start, limit)
+            _, remaining = _skip_lines(mm, window_end, len(mm))
+            total_lines = skipped + taken + remaining
+            # A last line without a terminator still counts
+            if mm and mm[-1] not in b'\r\n':
+                total_lines += 1
+
+            window = mm[window_start:window_end]
+
+        # Only the returned lines are decoded, so only they pick the encoding
+        try:
+            text = window.decode('utf-8')
+        except UnicodeDecodeError:
+            text = window.decode('latin-1')
+        return _split_lines(text.replace('\r\n', '\n').replace('\r', '\n')), total_lines
+
     async def _read_image(self, path: Path, mime_type: str) -> str:
         """Read an image file and return base64 encoded data."""
         try:
@@ -1,5 +1,6 @@
 """Text processing utilities for fuzzy matching and encoding handling."""
 
+import functools
 import unicodedata
 from dataclasses import dataclass
 from typing import Tuple, Literal
@@ -43,6 +44,12 @@ SPACE_MAPPING = {
     '\u3000': ' ',  # IDEOGRAPHIC SPACE
 }
 
+# Single translation table applying all of the mappings above in one pass
+_FUZZY_TABLE = str.maketrans({**SMART_QUOTE_MAPPING, **DASH_MAPPING, **SPACE_MAPPING})
+
+# Number of leading characters inspected by detect_line_ending
+LINE_ENDING_SAMPLE_SIZE = 64 * 1024
+
 
 def strip_bom(content: str) -> Tuple[str, str]:
     """
@@ -54,26 +61,33 @@ def strip_bom(content: str) -> Tuple[str, str]:
     Returns:
         Tuple of (bom, text_without_bom) where bom is '' or the BOM string
     """
-    bom = ''
-    if content.startswith('\ufeff'):
-        bom = '\ufeff'
-        content = content[1:]
-    return bom, content
+    # removeprefix returns the same object when there is no BOM
+    stripped = content.removeprefix('\ufeff')
+    if stripped is content:
+        return '', content
+    return '\ufeff', stripped
 
 
 def detect_line_ending(content: str) -> Literal['\r\n', '\n']:
     """
     Detect the dominant line ending style in content.
 
+    Only the first LINE_ENDING_SAMPLE_SIZE characters are inspected.
+
     Args:
         content: The text content to analyze
 
     Returns:
         '\r\n' for CRLF, '\n' for LF (default)
     """
-    crlf_count = content.count('\r\n')
+    # Line endings are uniform in practice, so a bounded prefix is enough
+    sample = content[:LINE_ENDING_SAMPLE_SIZE]
+    # Without any CR there is nothing to count; a single memchr scan settles it
+    if '\r' not in sample:
+        return '\n'
+    crlf_count = sample.count('\r\n')
     # Count standalone LF (not preceded by CR)
-    lf_count = content.count('\n') - crlf_count
+    lf_count = sample.count('\n') - crlf_count
 
     if crlf_count > lf_count:
         return '\r\n'
@@ -90,6 +104,9 @@ def normalize_to_lf(text: str) -> str:
     Returns:
         Text with all line endings converted to LF
     """
+    # Most files are already LF-only; skip both replace passes for them
+    if '\r' not in text:
+        return text
     return text.replace('\r\n', '\n').replace('\r', '\n')
 
 
@@ -119,28 +136,31 @@ def normalize_for_fuzzy_match(text: str) -> str:
     - Various space characters to regular space
     - Unicode normalization (NFC)
 
+    Results for short texts are memoized, since an edit normalizes the same
+    needle several times (counting, matching, error reporting).
+
     Args:
         text: The text to normalize
 
     Returns:
         Normalized text suitable for fuzzy comparison
     """
-    # Apply Unicode normalization first
-    text = unicodedata.normalize('NFC', text)
-
-    # Create translation table
-    result = []
-    for char in text:
-        if char in SMART_QUOTE_MAPPING:
-            result.append(SMART_QUOTE_MAPPING[char])
-        elif char in DASH_MAPPING:
-            result.append(DASH_MAPPING[char])
-        elif char in SPACE_MAPPING:
-            result.append(SPACE_MAPPING[char])
-        else:
-            result.append(char)
+    if len(text) <= _FUZZY_CACHE_MAX_TEXT:
+        return _normalize_cached(text)
+    return _normalize_for_fuzzy_match(text)
+
+
+def _normalize_for_fuzzy_match(text: str) -> str:
+    """Uncached implementation of normalize_for_fuzzy_match."""
+    # Apply Unicode normalization first, then map quotes, dashes and spaces
+    return unicodedata.normalize('NFC', text).translate(_FUZZY_TABLE)
+
 
-    return ''.join(result)
+# Only short texts (needles, single characters) are cached, so the cache
+# holds at most 256 entries of up to 1024 characters; whole file contents
+# are normalized each time rather than kept alive
+_FUZZY_CACHE_MAX_TEXT = 1024
+_normalize_cached = functools.lru_cache(maxsize=256)(_normalize_for_fuzzy_match)
 
 
 @dataclass
@@ -178,21 +198,36 @@ def fuzzy_find_text(content: str, old_text: str) -> FuzzyMatchResult:
             content_for_replacement=content,
         )
 
+    # Normalization leaves ASCII text unchanged, so when both sides are
+    # ASCII a fuzzy search would repeat the exact one
+    if content.isascii() and old_text.isascii():
+        return FuzzyMatchResult(
+            found=False,
+            index=-1,
+            match_length=0,
+            used_fuzzy_match=False,
+            content_for_replacement=content,
+        )
+
     # Fall back to fuzzy matching
     normalized_content = normalize_for_fuzzy_match(content)
     normalized_old = normalize_for_fuzzy_match(old_text)
 
     fuzzy_index = normalized_content.find(normalized_old)
     if fuzzy_index != -1:
-        # We need to find the corresponding position in the original content
-        # This is complex because normalization may change character lengths
-        # We'll use a character-by-character mapping approach
-
-        # Find the corresponding original substring
-        original_index = _find_original_index(content, normalized_content, fuzzy_index)
-        original_end = _find_original_index(
-            content, normalized_content, fuzzy_index + len(normalized_old)
-        )
+        if unicodedata.is_normalized('NFC', content):
+            # NFC leaves the content as is and the translate table maps one
+            # character to one, so positions carry over unchanged
+            original_index = fuzzy_index
+            original_end = fuzzy_index + len(normalized_old)
+        else:
+            # We need to find the corresponding position in the original content
+            # This is complex because normalization may change character lengths
+            # We'll use a character-by-character mapping approach
+            original_index = _find_original_index(content, normalized_content, fuzzy_index)
+            original_end = _find_original_index(
+                content, normalized_content, fuzzy_index + len(normalized_old)
+            )
 
         if original_index is not None and original_end is not None:
             return FuzzyMatchResult(
@@ -1,10 +1,25 @@
 """Output truncation utilities."""
 
+import itertools
+import re
 from dataclasses import dataclass
 from typing import Literal, Optional
 
+_NEWLINE = re.compile(b'\n')
 
-@dataclass
+# Maps each byte value to b'L' if it starts a UTF-8 character or b'C' if it is
+# a continuation byte (pattern 10xxxxxx, 0x80-0xBF)
+_UTF8_BYTE_CLASS = bytes(ord('C') if (b & 0xC0) == 0x80 else ord('L') for b in range(256))
+
+# Maps each lead byte to the length of the UTF-8 sequence it starts
+# (0xxxxxxx: 1, 110xxxxx: 2, 1110xxxx: 3, 11110xxx: 4)
+_UTF8_SEQUENCE_LENGTH = bytes(
+    4 if b >= 0xF0 else 3 if b >= 0xE0 else 2 if b >= 0xC0 else 1
+    for b in range(256)
+)
+
+
+@dataclass(slots=True)
 class TruncationResult:
     """Result of truncation operation."""
     content: str
@@ -21,6 +36,11 @@ class TruncationResult:
     def lines_removed(self) -> int:
         return self.original_lines - self.truncated_lines
 
+    @property
+    def content_bytes(self) -> bytes:
+        """UTF-8 encoding of content, computed on each access so it follows content."""
+        return self.content.encode('utf-8')
+
 
 def truncate_head(
     content: str,
@@ -38,8 +58,7 @@ def truncate_head(
     Returns:
         TruncationResult with truncated content
     """
-    original_lines = content.count('\n') + 1 if content else 0
-    original_bytes = len(content.encode('utf-8'))
+    encoded, original_lines, original_bytes = _measure(content)
 
     if original_lines <= max_lines and original_bytes <= max_bytes:
         return TruncationResult(
@@ -51,49 +70,76 @@ def truncate_head(
             truncated_bytes=original_bytes,
         )
 
-    lines = content.split('\n')
+    is_ascii = encoded is None
+    if is_ascii:
+        encoded = content.encode('ascii')
+
+    start, truncated_by, last_line_partial, first_line_exceeds_limit = (
+        _truncate_head_encoded(encoded, max_lines, max_bytes)
+    )
+
+    # Build the kept text in a single allocation: ASCII offsets are character
+    # indices, and otherwise decode straight from a view of the encoded buffer
+    truncated = content[start:] if is_ascii else str(memoryview(encoded)[start:], 'utf-8')
+
+    return TruncationResult(
+        content=truncated,
+        was_truncated=True,
+        original_lines=original_lines,
+        original_bytes=original_bytes,
+        truncated_lines=truncated.count('\n') + 1 if truncated else 0,
+        truncated_bytes=len(encoded) - start,
+        truncated_by=truncated_by,
+        last_line_partial=last_line_partial,
+        first_line_exceeds_limit=first_line_exceeds_limit,
+    )
+
+
+def _truncate_head_encoded(
+    encoded: bytes,
+    max_lines: int,
+    max_bytes: int,
+) -> tuple[int, Optional[Literal['lines', 'bytes']], bool, bool]:
+    """
+    Find where to cut encoded content to keep its tail within max_lines and max_bytes.
+
+    Returns:
+        Tuple of (start offset of the kept tail, truncated_by, last_line_partial,
+        first_line_exceeds_limit)
+    """
     truncated_by = None
     last_line_partial = False
     first_line_exceeds_limit = False
 
-    # Truncate by lines first
-    if len(lines) > max_lines:
+    # Track where the kept tail starts; the caller slices once
+    start = 0
+
+    # Truncate by lines first, keeping everything after the max_lines-th newline from the end.
+    # A cut before the last max_bytes + 1 bytes would be overridden by the byte
+    # limit below, so the walk never needs to look further back than that.
+    if max_lines > 0:
+        newline_idx = _rfind_nth_newline(encoded, max_lines, len(encoded) - max_bytes - 1)
+    else:
+        newline_idx = len(encoded) - 1
+    if newline_idx != -1:
         truncated_by = 'lines'
-        removed_count = len(lines) - max_lines
-        lines = lines[removed_count:]
-        content = '\n'.join(lines)
+        start = newline_idx + 1
 
     # Check bytes after line truncation
-    current_bytes = len(content.encode('utf-8'))
-    if current_bytes > max_bytes:
+    if len(encoded) - start > max_bytes:
         truncated_by = 'bytes'
         # Use UTF-8 safe truncation
-        truncated_content = truncate_string_to_bytes_from_end(content, max_bytes)
+        start = _char_start_at_or_after(encoded, len(encoded) - max_bytes)
         # Find first newline to start at a clean line boundary
-        newline_idx = truncated_content.find('\n')
+        newline_idx = encoded.find(b'\n', start)
         if newline_idx != -1:
-            truncated_content = truncated_content[newline_idx + 1:]
-            last_line_partial = False
+            start = newline_idx + 1
         else:
             # No newline found, we're starting mid-line
             first_line_exceeds_limit = True
             last_line_partial = True
-        content = truncated_content
 
-    final_lines = content.count('\n') + 1 if content else 0
-    final_bytes = len(content.encode('utf-8'))
-
-    return TruncationResult(
-        content=content,
-        was_truncated=True,
-        original_lines=original_lines,
-        original_bytes=original_bytes,
-        truncated_lines=final_lines,
-        truncated_bytes=final_bytes,
-        truncated_by=truncated_by,
-        last_line_partial=last_line_partial,
-        first_line_exceeds_limit=first_line_exceeds_limit,
-    )
+    return start, truncated_by, last_line_partial, first_line_exceeds_limit
 
 
 def truncate_tail(
@@ -104,6 +150,9 @@ def truncate_tail(
     """
     Truncate content from the tail (keeping the head).
 
+    The content is encoded once and truncated in the byte domain, so byte
+    limits are applied to UTF-8 byte offsets rather than character indices.
+
     Args:
         content: The content to truncate
         max_lines: Maximum number of lines
@@ -112,8 +161,7 @@ def truncate_tail(
     Returns:
         TruncationResult with truncated content
     """
-    original_lines = content.count('\n') + 1 if content else 0
-    original_bytes = len(content.encode('utf-8'))
+    encoded, original_lines, original_bytes = _measure(content)
 
     if original_lines <= max_lines and original_bytes <= max_bytes:
         return TruncationResult(
@@ -125,48 +173,109 @@ def truncate_tail(
             truncated_bytes=original_bytes,
         )
 
-    lines = content.split('\n')
+    is_ascii = encoded is None
+    if is_ascii:
+        encoded = content.encode('ascii')
+
+    end, truncated_by, last_line_partial, first_line_exceeds_limit = (
+        _truncate_tail_encoded(encoded, max_lines, max_bytes)
+    )
+
+    # Build the kept text in a single allocation: ASCII offsets are character
+    # indices, and otherwise decode straight from a view of the encoded buffer
+    truncated = content[:end] if is_ascii else str(memoryview(encoded)[:end], 'utf-8')
+
+    return TruncationResult(
+        content=truncated,
+        was_truncated=True,
+        original_lines=original_lines,
+        original_bytes=original_bytes,
+        truncated_lines=truncated.count('\n') + 1 if truncated else 0,
+        truncated_bytes=end,
+        truncated_by=truncated_by,
+        last_line_partial=last_line_partial,
+        first_line_exceeds_limit=first_line_exceeds_limit,
+    )
+
+
+def _truncate_tail_encoded(
+    encoded: bytes,
+    max_lines: int,
+    max_bytes: int,
+) -> tuple[int, Optional[Literal['lines', 'bytes']], bool, bool]:
+    """
+    Find where to cut encoded content to keep its head within max_lines and max_bytes.
+
+    Returns:
+        Tuple of (end offset of the kept head, truncated_by, last_line_partial,
+        first_line_exceeds_limit)
+    """
     truncated_by = None
     last_line_partial = False
     first_line_exceeds_limit = False
 
-    # Truncate by lines first
-    if len(lines) > max_lines:
+    # Track where the kept head ends; the caller slices once
+    end = len(encoded)
+
+    # Truncate by lines first, keeping everything before the max_lines-th newline.
+    # A cut past max_bytes would be overridden by the byte limit below, so the
+    # walk never needs to look further than that.
+    newline_idx = _find_nth_newline(encoded, max_lines, max_bytes + 1) if max_lines > 0 else 0
+    if newline_idx != -1:
         truncated_by = 'lines'
-        lines = lines[:max_lines]
-        content = '\n'.join(lines)
+        end = newline_idx
 
     # Check bytes after line truncation
-    current_bytes = len(content.encode('utf-8'))
-    if current_bytes > max_bytes:
+    if end > max_bytes:
         truncated_by = 'bytes'
         # Use UTF-8 safe truncation
-        truncated_content = truncate_string_to_bytes_from_start(content, max_bytes)
+        end = _char_boundary_at_or_before(encoded, max_bytes)
         # Find last newline to end at a clean line boundary
-        newline_idx = truncated_content.rfind('\n')
+        newline_idx = encoded.rfind(b'\n', 0, end)
         if newline_idx != -1:
-            truncated_content = truncated_content[:newline_idx]
-            last_line_partial = False
+            end = newline_idx
         else:
             # No newline found, entire content is on one line that exceeds limit
             first_line_exceeds_limit = True
             last_line_partial = True
-        content = truncated_content
 
-    final_lines = content.count('\n') + 1 if content else 0
-    final_bytes = len(content.encode('utf-8'))
+    return end, truncated_by, last_line_partial, first_line_exceeds_limit
 
-    return TruncationResult(
-        content=content,
-        was_truncated=True,
-        original_lines=original_lines,
-        original_bytes=original_bytes,
-        truncated_lines=final_lines,
-        truncated_bytes=final_bytes,
-        truncated_by=truncated_by,
-        last_line_partial=last_line_partial,
-        first_line_exceeds_limit=first_line_exceeds_limit,
-    )
+
+def _measure(content: str) -> tuple[Optional[bytes], int, int]:
+    """
+    Count the lines and UTF-8 bytes of content.
+
+    Pure-ASCII content has one byte per character, so it is measured without
+    being encoded and None is returned in place of the encoded bytes.
+
+    Returns:
+        Tuple of (encoded content or None, line count, byte count)
+    """
+    if content.isascii():
+        return None, content.count('\n') + 1 if content else 0, len(content)
+
+    encoded = content.encode('utf-8')
+    return encoded, encoded.count(b'\n') + 1, len(encoded)
+
+
+def _find_nth_newline(content: bytes, n: int, limit: int) -> int:
+    """Return the index of the n-th newline before limit, or -1 if there are fewer."""
+    # Let the regex engine and islice skip the first n - 1 newlines in C
+    # rather than calling find() once per line from Python
+    match = next(itertools.islice(_NEWLINE.finditer(content, 0, limit), n - 1, None), None)
+    return match.start() if match is not None else -1
+
+
+def _rfind_nth_newline(content: bytes, n: int, limit: int) -> int:
+    """Return the index of the n-th newline from the end at or after limit, or -1 if there are fewer."""
+    start = max(limit, 0)
+    pos = len(content)
+    for _ in range(n):
+        pos = content.rfind(b'\n', start, pos)
+        if pos == -1:
+            break
+    return pos
 
 
 def format_truncation_notice(result: TruncationResult, direction: str = "head") -> str:
@@ -198,21 +307,15 @@ def truncate_string_to_bytes_from_end(text: str, max_bytes: int) -> str:
     if not text:
         return text
 
+    if text.isascii():
+        return text[max(0, len(text) - max_bytes):]
+
     encoded = text.encode('utf-8')
 
     if len(encoded) <= max_bytes:
         return text
 
-    # Calculate starting position
-    start = len(encoded) - max_bytes
-
-    # Skip continuation bytes (0x80-0xBF) to find a valid character boundary
-    # Continuation bytes have the pattern 10xxxxxx (0x80-0xBF)
-    while start < len(encoded) and (encoded[start] & 0xC0) == 0x80:
-        start += 1
-
-    # Decode from the valid starting position
-    return encoded[start:].decode('utf-8')
+    return _truncate_bytes_from_end(encoded, max_bytes).decode('utf-8')
 
 
 def truncate_string_to_bytes_from_start(text: str, max_bytes: int) -> str:
@@ -233,20 +336,51 @@ def truncate_string_to_bytes_from_start(text: str, max_bytes: int) -> str:
     if not text:
         return text
 
+    if text.isascii():
+        return text[:max_bytes]
+
     encoded = text.encode('utf-8')
 
     if len(encoded) <= max_bytes:
         return text
 
-    # Truncate to max_bytes
-    truncated = encoded[:max_bytes]
+    return _truncate_bytes_from_start(encoded, max_bytes).decode('utf-8')
 
-    # Work backwards to find a valid UTF-8 boundary
-    # Try decoding and back off until we find a valid boundary
-    while truncated:
-        try:
-            return truncated.decode('utf-8')
-        except UnicodeDecodeError:
-            truncated = truncated[:-1]
 
-    return ''
+def _truncate_bytes_from_end(encoded: bytes, max_bytes: int) -> bytes:
+    """Keep at most the last max_bytes of encoded, starting on a UTF-8 character boundary."""
+    if len(encoded) <= max_bytes:
+        return encoded
+    return encoded[_char_start_at_or_after(encoded, len(encoded) - max_bytes):]
+
+
+def _truncate_bytes_from_start(encoded: bytes, max_bytes: int) -> bytes:
+    """Keep at most the first max_bytes of encoded, ending on a UTF-8 character boundary."""
+    if len(encoded) <= max_bytes:
+        return encoded
+    return encoded[:_char_boundary_at_or_before(encoded, max_bytes)]
+
+
+def _char_start_at_or_after(encoded: bytes, pos: int) -> int:
+    """Return the offset of the first UTF-8 character starting at or after pos."""
+    # Skip continuation bytes (0x80-0xBF) to find a valid character boundary.
+    # A character has at most three of them, so the next lead byte is within
+    # the following four bytes; classify them in one translate() call.
+    offset = encoded[pos:pos + 4].translate(_UTF8_BYTE_CLASS).find(b'L')
+    if offset == -1:
+        return len(encoded)
+    return pos + offset
+
+
+def _char_boundary_at_or_before(encoded: bytes, end: int) -> int:
+    """Return the largest offset <= end that does not split a UTF-8 character."""
+    # Find the last lead byte among the four bytes before end and cut before
+    # its character if that character's sequence would be left incomplete
+    tail = encoded[max(0, end - 4):end]
+    lead_idx = tail.translate(_UTF8_BYTE_CLASS).rfind(b'L')
+    if lead_idx == -1:
+        return end
+    kept = len(tail) - lead_idx
+    if kept < _UTF8_SEQUENCE_LENGTH[tail[lead_idx]]:
+        return end - kept
+    return end
@@ -7,6 +7,9 @@ from typing import Optional
 from .base import BaseTool
 from .registry import register_tool
 
+# Flags for writing the encoded bytes straight to a file descriptor
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 @register_tool
 class WriteTool(BaseTool):
@@ -62,16 +65,22 @@ class WriteTool(BaseTool):
         # Check if file exists
         existed = path.exists()
 
-        # Write the content
+        # Write the content, encoding it once and bypassing the text I/O stack
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            encoded = content.encode('utf-8')
+            fd = os.open(path, _WRITE_FLAGS, 0o666)
+            try:
+                view = memoryview(encoded)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
         except Exception as e:
             return f"Error writing file: {e}"
 
         # Return summary
-        lines = content.count('\n') + 1 if content else 0
-        bytes_written = len(content.encode('utf-8'))
+        lines = encoded.count(b'\n') + 1 if encoded else 0
+        bytes_written = len(encoded)
 
         action = "Updated" if existed else "Created"
         return f"{action} file: {file_path}\nLines: {lines}\nBytes: {bytes_written}"
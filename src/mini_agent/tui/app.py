@@ -1,6 +1,7 @@
 """Main TUI application for mini-agent."""
 
 import asyncio
+import logging
 from typing import Optional
 
 from textual.app import App, ComposeResult
@@ -10,73 +11,84 @@ from textual.reactive import reactive
 from textual.binding import Binding
 
 from ..agent import Agent, AgentEvent, AgentEventType
+from ..debug import get_event_logger
 from ..session import SessionManager
 from ..tools import ReadTool, WriteTool, EditTool, BashTool, GrepTool, FindTool, ListTool
 from .widgets import MessageWidget, ToolExecutionWidget, StreamingTextWidget, StatusBar
-from .theme import DEFAULT_THEME
+from .theme import DEFAULT_THEME, Theme
 
+_event_logger = get_event_logger("tui")
 
-class MiniAgentApp(App):
-    """Main TUI application for Mini Agent."""
 
-    CSS = f"""
+def _build_css(theme: Theme) -> str:
+    """Build the application stylesheet for a theme."""
+    return f"""
     Screen {{
-        background: {DEFAULT_THEME.bg_primary};
+        background: {theme.bg_primary};
     }}
 
     .message-container {{
         height: 1fr;
-        background: {DEFAULT_THEME.bg_secondary};
+        background: {theme.bg_secondary};
         padding: 1;
     }}
 
     .input-container {{
         height: auto;
-        background: {DEFAULT_THEME.bg_primary};
+        background: {theme.bg_primary};
         padding: 1;
-        border-top: solid {DEFAULT_THEME.bg_tertiary};
+        border-top: solid {theme.bg_tertiary};
     }}
 
     Input {{
-        background: {DEFAULT_THEME.bg_secondary};
-        color: {DEFAULT_THEME.text_primary};
-        border: solid {DEFAULT_THEME.bg_tertiary};
+        background: {theme.bg_secondary};
+        color: {theme.text_primary};
+        border: solid {theme.bg_tertiary};
     }}
 
     Input:focus {{
-        border: solid {DEFAULT_THEME.accent_primary};
+        border: solid {theme.accent_primary};
     }}
 
     Button {{
-        background: {DEFAULT_THEME.accent_primary};
-        color: {DEFAULT_THEME.bg_primary};
+        background: {theme.accent_primary};
+        color: {theme.bg_primary};
     }}
 
     .status-bar {{
-        background: {DEFAULT_THEME.bg_tertiary};
-        color: {DEFAULT_THEME.text_primary};
+        background: {theme.bg_tertiary};
+        color: {theme.text_primary};
         padding: 0 1;
     }}
 
     MessageWidget {{
         margin: 1 0;
         padding: 1;
-        background: {DEFAULT_THEME.bg_secondary};
+        background: {theme.bg_secondary};
     }}
 
     StreamingTextWidget {{
         margin: 1 0;
         padding: 1;
-        background: {DEFAULT_THEME.bg_secondary};
+        background: {theme.bg_secondary};
     }}
 
     ToolExecutionWidget {{
         margin: 1 0;
         padding: 1;
-        background: {DEFAULT_THEME.bg_tertiary};
+        background: {theme.bg_tertiary};
     }}
     """
 
+
+_DEFAULT_CSS = _build_css(DEFAULT_THEME)
+
+
+class MiniAgentApp(App):
+    """Main TUI application for Mini Agent."""
+
+    CSS = _DEFAULT_CSS
+
     BINDINGS = [
         Binding("ctrl+c", "quit", "Quit"),
         Binding("ctrl+n", "new_session", "New Session"),
@@ -123,6 +135,10 @@ class MiniAgentApp(App):
 
         # Streaming widget reference
         self._streaming_widget: Optional[StreamingTextWidget] = None
+        # Running tool widgets by tool name, most recent last
+        self._pending_tools: dict[str, list[ToolExecutionWidget]] = {}
+        # Short session id shown in the status bar, updated when the session changes
+        self._session_display = ""
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -144,9 +160,10 @@ class MiniAgentApp(App):
 
         # Load or create session
         if self.session_id:
-            self.session_manager.load_session(self.session_id)
+            session = self.session_manager.load_session(self.session_id)
         else:
-            self.session_manager.create_session(model=self.model)
+            session = self.session_manager.create_session(model=self.model)
+        self._session_display = session.id[:8] if session else ""
 
         # Update status bar
         self._update_status_bar()
@@ -169,7 +186,8 @@ class MiniAgentApp(App):
 
     def action_new_session(self) -> None:
         """Create a new session."""
-        self.session_manager.create_session(model=self.model)
+        session = self.session_manager.create_session(model=self.model)
+        self._session_display = session.id[:8]
         self.agent.clear_messages()
         self._clear_messages()
         self._update_status_bar()
@@ -216,6 +234,7 @@ class MiniAgentApp(App):
 
             # Finalize streaming widget
             if self._streaming_widget:
+                self._streaming_widget.flush()
                 # Fallback: if provider didn't emit stream deltas, show final text.
                 if not self._streaming_widget.text and response.text:
                     self._streaming_widget.text = response.text
@@ -240,16 +259,13 @@ class MiniAgentApp(App):
 
     def _on_agent_event(self, event: AgentEvent) -> None:
         """Handle agent events."""
-        # Log to file for debugging
-        with open("/tmp/mini-agent-events.log", "a") as f:
-            f.write(f"[DEBUG TUI] Event received: {event.type}, data: {str(event.data)[:100]}\n")
+        if _event_logger.isEnabledFor(logging.DEBUG):
+            _event_logger.debug("Event received: %s, data: %.100s", event.type, event.data)
 
         if event.type == AgentEventType.STREAM_TEXT:
             if self._streaming_widget and event.data:
                 delta = event.data.get("delta", "")
                 self._streaming_widget.append(delta)
-                container = self.query_one("#message-container", ScrollableContainer)
-                container.scroll_end()
 
         elif event.type == AgentEventType.TOOL_CALL:
             if event.data:
@@ -278,32 +294,30 @@ class MiniAgentApp(App):
         widget.status = "running"
         container.mount(widget)
         container.scroll_end()
+        self._pending_tools.setdefault(tool_name, []).append(widget)
 
     def _update_tool_result(self, tool_name: str, result: str) -> None:
         """Update tool execution result."""
-        # Find the last tool widget with this name
-        container = self.query_one("#message-container", ScrollableContainer)
-        for widget in reversed(container.children):
-            if isinstance(widget, ToolExecutionWidget) and widget.tool_name == tool_name:
-                widget.status = "completed"
-                widget.result = result
-                break
+        # Complete the most recent running tool widget with this name
+        widgets = self._pending_tools.get(tool_name)
+        if widgets:
+            widget = widgets.pop()
+            widget.status = "completed"
+            widget.result = result
 
     def _clear_messages(self) -> None:
         """Clear all messages."""
         container = self.query_one("#message-container", ScrollableContainer)
         container.remove_children()
         self._streaming_widget = None
+        self._pending_tools.clear()
 
     def _update_status_bar(self) -> None:
         """Update the status bar."""
-        info = self.session_manager.get_session_info()
-        session_id = info.get("id", "") if info else ""
-
         status_bar = self.query_one(".status-bar", StatusBar)
         status_bar.status = self.status
         status_bar.model = self.model
-        status_bar.session_id = session_id[:8] if session_id else ""
+        status_bar.session_id = self._session_display
 
     async def run_async(self, **kwargs) -> None:
         """Run the app asynchronously."""
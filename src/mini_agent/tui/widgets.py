@@ -8,6 +8,13 @@ from textual.reactive import reactive
 
 from .theme import DEFAULT_THEME
 
+# Header color and label for each message role
+_ROLE_STYLES = {
+    "user": (DEFAULT_THEME.user_color, "👤 You"),
+    "assistant": (DEFAULT_THEME.assistant_color, "🤖 Assistant"),
+}
+_DEFAULT_ROLE_STYLE = (DEFAULT_THEME.tool_color, "⚙️ Tool")
+
 
 class MessageWidget(Static):
     """Widget to display a single message."""
@@ -15,24 +22,24 @@ class MessageWidget(Static):
     role = reactive("user")
     content = reactive("")
 
+    # Last rendered markup and the field values it was built from
+    _render_key: tuple | None = None
+    _render_value = ""
+
     def __init__(self, role: str, content: str, **kwargs):
         super().__init__(**kwargs)
         self.role = role
         self.content = content
 
     def render(self) -> str:
-        # Color based on role
-        if self.role == "user":
-            color = DEFAULT_THEME.user_color
-            prefix = "👤 You"
-        elif self.role == "assistant":
-            color = DEFAULT_THEME.assistant_color
-            prefix = "🤖 Assistant"
-        else:
-            color = DEFAULT_THEME.tool_color
-            prefix = "⚙️ Tool"
+        key = (self.role, self.content)
+        if key == self._render_key:
+            return self._render_value
 
-        return f"[bold {color}]{prefix}[/]\n{self.content}"
+        color, prefix = _ROLE_STYLES.get(self.role, _DEFAULT_ROLE_STYLE)
+        self._render_value = f"[bold {color}]{prefix}[/]\n{self.content}"
+        self._render_key = key
+        return self._render_value
 
 
 class ToolExecutionWidget(Static):
@@ -42,11 +49,19 @@ class ToolExecutionWidget(Static):
     status = reactive("pending")
     result = reactive("")
 
+    # Last rendered markup and the field values it was built from
+    _render_key: tuple | None = None
+    _render_value = ""
+
     def __init__(self, tool_name: str, **kwargs):
         super().__init__(**kwargs)
         self.tool_name = tool_name
 
     def render(self) -> str:
+        key = (self.tool_name, self.status, self.result)
+        if key == self._render_key:
+            return self._render_value
+
         color = DEFAULT_THEME.tool_color
         status_icon = "⏳" if self.status == "running" else "✓"
 
@@ -59,27 +74,49 @@ class ToolExecutionWidget(Static):
                 result_text = result_text[:500] + "..."
             lines.append(f"[dim]{result_text}[/]")
 
-        return "\n".join(lines)
+        self._render_value = "\n".join(lines)
+        self._render_key = key
+        return self._render_value
 
 
 class StreamingTextWidget(Static):
     """Widget for streaming text output."""
 
+    # Deltas are coalesced and rendered at most once per frame (~60 FPS)
+    FLUSH_INTERVAL = 1 / 60
+
     text = reactive("")
     is_streaming = reactive(False)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._buffer = ""
+        # Rendered text followed by the deltas queued since the last flush
+        self._chunks: list[str] = []
+        self._rendered_chunks = 0
+
+    def on_mount(self) -> None:
+        self.set_interval(self.FLUSH_INTERVAL, self.flush)
 
     def append(self, text: str) -> None:
-        """Append text to the buffer."""
-        self._buffer += text
-        self.text = self._buffer
+        """Queue text to be shown on the next flush."""
+        self._chunks.append(text)
+
+    def flush(self) -> None:
+        """Render queued text and keep the end of the container in view."""
+        if len(self._chunks) == self._rendered_chunks:
+            return
+        text = "".join(self._chunks)
+        # Keep a single chunk so the next flush joins just the new deltas onto it
+        self._chunks = [text]
+        self._rendered_chunks = 1
+        self.text = text
+        if self.parent is not None:
+            self.parent.scroll_end(animate=False)
 
     def clear(self) -> None:
         """Clear the buffer."""
-        self._buffer = ""
+        self._chunks.clear()
+        self._rendered_chunks = 0
         self.text = ""
 
     def render(self) -> str:
@@ -111,7 +148,15 @@ class StatusBar(Static):
     model = reactive("gpt-4o")
     session_id = reactive("")
 
+    # Last rendered markup and the field values it was built from
+    _render_key: tuple | None = None
+    _render_value = ""
+
     def render(self) -> str:
+        key = (self.model, self.session_id, self.status)
+        if key == self._render_key:
+            return self._render_value
+
         parts = [f"Model: {self.model}"]
 
         if self.session_id:
@@ -119,4 +164,6 @@ class StatusBar(Static):
 
         parts.append(f"Status: {self.status}")
 
-        return " | ".join(parts)
+        self._render_value = " | ".join(parts)
+        self._render_key = key
+        return self._render_value
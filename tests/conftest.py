@@ -0,0 +1,70 @@
+"""Shared test fixtures."""
+
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def fast_tmp():
+    """
+    Scratch directory shared by the whole test run.
+
+    Lives in /dev/shm when available so file fixtures stay in memory, and
+    is removed in one go at the end of the session. Set MINIAGENT_TEST_TMP
+    to use another location.
+    """
+    base = os.environ.get("MINIAGENT_TEST_TMP")
+    if not base:
+        base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    root = Path(base) / f"miniagent-{os.getpid()}"
+    root.mkdir(parents=True, exist_ok=True)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def fast_tmpfile(fast_tmp):
+    """
+    Factory writing content to a new uniquely named file under fast_tmp.
+
+    Names come from uuid4, so each file takes one open() instead of
+    NamedTemporaryFile's random-name retry loop. Returns the file's path.
+    """
+    def create(content: str = "") -> str:
+        path = str(fast_tmp / f"{uuid.uuid4().hex}.txt")
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        return path
+
+    return create
+
+
+@pytest.fixture(scope="session")
+def list_fixture_dir(fast_tmp):
+    """Read-only directory tree with two files and a subdirectory, built once."""
+    root = fast_tmp / "list-fixture"
+    root.mkdir()
+    (root / "file1.txt").touch()
+    (root / "file2.txt").touch()
+    (root / "subdir").mkdir()
+    return str(root)
+
+
+@pytest.fixture(scope="module")
+def hundred_lines():
+    """100 short lines ("line 0" to "line 99") without a trailing newline."""
+    return "\n".join(f"line {i}" for i in range(100))
+
+
+@pytest.fixture(scope="module")
+def x_blob_10k():
+    """A single 10,000-character line."""
+    return "x" * 10000
@@ -98,6 +98,63 @@ class TestGenerateDiffString:
         result = generate_diff_string(old, new)
         assert result.first_changed_line == 1
 
+    def test_first_changed_line_after_common_prefix(self):
+        """First change should be the first line that differs."""
+        old = "a\nb\nc\nc\nb\n"
+        new = "a\nb\nb\nc\nc\n"
+        result = generate_diff_string(old, new)
+        assert result.first_changed_line == 3
+
+    def test_hunk_line_numbers(self):
+        """Hunk ranges should count the unchanged lines around the edit."""
+        old = "".join(f"line{i}\n" for i in range(100))
+        new = old.replace("line50\n", "modified\n")
+        result = generate_diff_string(old, new, context_lines=2)
+        assert "@@ -49,5 +49,5 @@" in result.diff
+        assert " line48\n" in result.diff
+        assert " line52\n" in result.diff
+        assert "line47" not in result.diff
+        assert "line53" not in result.diff
+
+    def test_scattered_changes_in_large_file(self):
+        """Many separate edits in a large file should each get a hunk."""
+        old_lines = [f"line{i}\n" for i in range(2000)]
+        new_lines = list(old_lines)
+        for i in range(0, 2000, 100):
+            new_lines[i] = f"changed{i}\n"
+        result = generate_diff_string("".join(old_lines), "".join(new_lines), context_lines=2)
+        assert result.diff.count("@@ -") == 20
+        assert "-line1900\n+changed1900\n" in result.diff
+        assert result.first_changed_line == 1
+
+    def test_huge_change_shown_as_single_replacement(self, monkeypatch):
+        """A changed region over the size limit should be replaced wholesale."""
+        import mini_agent.tools.diff_utils as diff_module
+        monkeypatch.setattr(diff_module, "_WHOLE_REPLACE_THRESHOLD", 4)
+
+        old = "keep\na\nb\nc\nkeep2\n"
+        new = "keep\nx\nb\nz\nkeep2\n"
+        result = generate_diff_string(old, new, context_lines=1)
+        assert "@@ -1,5 +1,5 @@" in result.diff
+        # The unchanged middle line is not matched inside the region
+        assert "-a\n-b\n-c\n+x\n+b\n+z\n" in result.diff
+        assert " keep\n" in result.diff
+        assert result.first_changed_line == 2
+
+    def test_scattered_changes_over_size_limit_keep_separate_hunks(self, monkeypatch):
+        """The size limit should apply to changed regions, not the whole file."""
+        import mini_agent.tools.diff_utils as diff_module
+        monkeypatch.setattr(diff_module, "_WHOLE_REPLACE_THRESHOLD", 1000)
+
+        old_lines = [f"line{i}\n" for i in range(2000)]
+        new_lines = list(old_lines)
+        for i in range(0, 2000, 100):
+            new_lines[i] = f"changed{i}\n"
+        result = generate_diff_string("".join(old_lines), "".join(new_lines), context_lines=2)
+        assert result.diff.count("@@ -") == 20
+        assert "-line1900\n+changed1900\n" in result.diff
+        assert "-line1899\n" not in result.diff
+
 
 class TestFormatDiffForOutput:
     """Tests for diff formatting."""
@@ -127,6 +184,32 @@ class TestFormatDiffForOutput:
         output = format_diff_for_output(result, max_lines=20)
         assert "truncated" in output
 
+    def test_truncated_diff_keeps_header_and_tail(self):
+        """Truncation should keep the header and the last lines."""
+        lines = ["--- a/file", "+++ b/file"] + [f"+line{i}" for i in range(10)]
+        diff = "\n".join(lines) + "\n"
+        result = DiffResult(diff=diff, first_changed_line=1)
+        output = format_diff_for_output(result, max_lines=5)
+        assert output == (
+            "--- a/file\n+++ b/file\n"
+            "... (truncated 7 lines)\n"
+            "+line7\n+line8\n+line9\n"
+            "\nFirst change at line 1"
+        )
+
+    @pytest.mark.parametrize("separator", ["\r", "\x0c", "\u2028"])
+    def test_truncated_diff_counts_lines_like_splitlines(self, separator):
+        """Line boundaries other than '\\n' should count as lines too."""
+        body = "".join(f"+line{i}{separator}" for i in range(10))
+        diff = "--- a/file\n+++ b/file\n" + body
+        result = DiffResult(diff=diff, first_changed_line=None)
+        output = format_diff_for_output(result, max_lines=5)
+        assert output == (
+            "--- a/file\n+++ b/file\n"
+            "... (truncated 7 lines)\n"
+            f"+line7{separator}+line8{separator}+line9{separator}"
+        )
+
     def test_includes_line_number(self):
         """Output should include first changed line number."""
         result = DiffResult(diff="some diff", first_changed_line=42)
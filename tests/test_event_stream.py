@@ -11,14 +11,17 @@ from mini_agent.ai.event_stream import (
 )
 from mini_agent.ai.types import StopReason
 
+# Share one event loop across the module instead of creating one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class TestEventStream:
-    @pytest.mark.asyncio
     async def test_basic_iteration(self):
         stream = EventStream()
 
         async def producer():
-            await asyncio.sleep(0.01)
+            # Yield once so the consumer is already waiting
+            await asyncio.sleep(0)
             stream.push(Event(EventType.TEXT_DELTA, "hello"))
             stream.push(Event(EventType.TEXT_DELTA, " world"))
             stream.end()
@@ -33,12 +36,11 @@ class TestEventStream:
         assert events[0].data == "hello"
         assert events[1].data == " world"
 
-    @pytest.mark.asyncio
     async def test_result(self):
         stream = EventStream()
 
         async def producer():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             from mini_agent.ai.types import AssistantMessage, TextContent
             msg = AssistantMessage(content=[TextContent(text="Hello")])
             stream.end(msg)
@@ -48,12 +50,11 @@ class TestEventStream:
         result = await stream.result()
         assert result.text == "Hello"
 
-    @pytest.mark.asyncio
     async def test_error(self):
         stream = EventStream()
 
         async def producer():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             stream.error(RuntimeError("Test error"))
 
         asyncio.create_task(producer())
@@ -61,7 +62,6 @@ class TestEventStream:
         with pytest.raises(RuntimeError, match="Test error"):
             await stream.result()
 
-    @pytest.mark.asyncio
     async def test_subscribe(self):
         stream = EventStream()
         received = []
@@ -74,11 +74,10 @@ class TestEventStream:
         stream.push(Event(EventType.TEXT_DELTA, "test"))
         stream.end()
 
-        await asyncio.sleep(0.01)
+        # Subscribers are called synchronously from push()
         assert len(received) == 1
         assert received[0].data == "test"
 
-    @pytest.mark.asyncio
     async def test_collect_text(self):
         stream = EventStream()
 
@@ -96,7 +95,6 @@ class TestEventStream:
 
 
 class TestAssistantMessageEventStream:
-    @pytest.mark.asyncio
     async def test_text_streaming(self):
         stream = AssistantMessageEventStream()
 
@@ -109,7 +107,6 @@ class TestAssistantMessageEventStream:
         msg = await stream.result()
         assert msg.text == "Hello World"
 
-    @pytest.mark.asyncio
     async def test_tool_call_streaming(self):
         stream = AssistantMessageEventStream()
 
@@ -126,7 +123,6 @@ class TestAssistantMessageEventStream:
         assert msg.tool_calls[0].name == "test_tool"
         assert msg.tool_calls[0].arguments == {"key": "value"}
 
-    @pytest.mark.asyncio
     async def test_multiple_content_blocks(self):
         stream = AssistantMessageEventStream()
 
@@ -151,7 +147,6 @@ class TestAssistantMessageEventStream:
         assert len(msg.content) == 3
         assert msg.stop_reason == StopReason.TOOL_USE
 
-    @pytest.mark.asyncio
     async def test_usage_tracking(self):
         stream = AssistantMessageEventStream()
 
@@ -5,70 +5,59 @@ from mini_agent.cli import detect_provider, MODEL_PROVIDERS
 
 
 class TestProviderDetection:
-    def test_openai_models(self):
-        """Test OpenAI model detection."""
-        assert detect_provider("gpt-4o") == "openai"
-        assert detect_provider("gpt-4o-mini") == "openai"
-        assert detect_provider("gpt-4-turbo") == "openai"
-        assert detect_provider("gpt-4") == "openai"
-        assert detect_provider("gpt-3.5-turbo") == "openai"
-        assert detect_provider("o1") == "openai"
-        assert detect_provider("o1-mini") == "openai"
-        assert detect_provider("o1-preview") == "openai"
-
-    def test_anthropic_models(self):
-        """Test Anthropic model detection."""
-        assert detect_provider("claude-sonnet-4-20250514") == "anthropic"
-        assert detect_provider("claude-sonnet-4") == "anthropic"
-        assert detect_provider("claude-3-5-sonnet-20241022") == "anthropic"
-        assert detect_provider("claude-3-5-sonnet") == "anthropic"
-        assert detect_provider("claude-3-5-haiku-20241022") == "anthropic"
-        assert detect_provider("claude-3-5-haiku") == "anthropic"
-        assert detect_provider("claude-3-opus-20240229") == "anthropic"
-        assert detect_provider("claude-3-opus") == "anthropic"
-        assert detect_provider("claude-3-sonnet") == "anthropic"
-        assert detect_provider("claude-3-haiku") == "anthropic"
-
-    def test_zhipu_glm_models(self):
-        """Test Zhipu AI GLM model detection (Anthropic-compatible)."""
-        assert detect_provider("glm-4-plus") == "anthropic"
-        assert detect_provider("glm-4-air") == "anthropic"
-        assert detect_provider("glm-4-airx") == "anthropic"
-        assert detect_provider("glm-4-flash") == "anthropic"
-        assert detect_provider("glm-4-long") == "anthropic"
-        assert detect_provider("glm-4v-plus") == "anthropic"
-        assert detect_provider("glm-4v-flash") == "anthropic"
-        assert detect_provider("glm-z1-air") == "anthropic"
-        assert detect_provider("glm-z1-airx") == "anthropic"
-        assert detect_provider("glm-z1-flash") == "anthropic"
-
-    def test_prefix_detection(self):
-        """Test detection by model name prefix."""
-        # Unknown GPT models should default to openai
-        assert detect_provider("gpt-5") == "openai"
-        assert detect_provider("gpt-new-model") == "openai"
-
-        # Unknown Claude models should default to anthropic
-        assert detect_provider("claude-new-model") == "anthropic"
-        assert detect_provider("claude-4-opus") == "anthropic"
-
-        # Unknown GLM models should default to anthropic
-        assert detect_provider("glm-new-model") == "anthropic"
-
-    def test_case_insensitive(self):
-        """Test case insensitive detection."""
-        assert detect_provider("GPT-4O") == "openai"
-        assert detect_provider("Claude-3-Opus") == "anthropic"
-        assert detect_provider("O1-MINI") == "openai"
-        assert detect_provider("GLM-4-PLUS") == "anthropic"
-
-    def test_unknown_model_defaults_to_anthropic(self):
-        """Test that unknown models default to Anthropic (supports custom endpoints)."""
-        assert detect_provider("unknown-model") == "anthropic"
-        assert detect_provider("llama-2") == "anthropic"
-        assert detect_provider("mistral") == "anthropic"
-
-    def test_model_provider_mapping_completeness(self):
+    @pytest.mark.parametrize("model,expected", [
+        # OpenAI models
+        ("gpt-4o", "openai"),
+        ("gpt-4o-mini", "openai"),
+        ("gpt-4-turbo", "openai"),
+        ("gpt-4", "openai"),
+        ("gpt-3.5-turbo", "openai"),
+        ("o1", "openai"),
+        ("o1-mini", "openai"),
+        ("o1-preview", "openai"),
+        # Anthropic models
+        ("claude-sonnet-4-20250514", "anthropic"),
+        ("claude-sonnet-4", "anthropic"),
+        ("claude-3-5-sonnet-20241022", "anthropic"),
+        ("claude-3-5-sonnet", "anthropic"),
+        ("claude-3-5-haiku-20241022", "anthropic"),
+        ("claude-3-5-haiku", "anthropic"),
+        ("claude-3-opus-20240229", "anthropic"),
+        ("claude-3-opus", "anthropic"),
+        ("claude-3-sonnet", "anthropic"),
+        ("claude-3-haiku", "anthropic"),
+        # Zhipu AI GLM models (Anthropic-compatible)
+        ("glm-4-plus", "anthropic"),
+        ("glm-4-air", "anthropic"),
+        ("glm-4-airx", "anthropic"),
+        ("glm-4-flash", "anthropic"),
+        ("glm-4-long", "anthropic"),
+        ("glm-4v-plus", "anthropic"),
+        ("glm-4v-flash", "anthropic"),
+        ("glm-z1-air", "anthropic"),
+        ("glm-z1-airx", "anthropic"),
+        ("glm-z1-flash", "anthropic"),
+        # Unknown models are detected by prefix
+        ("gpt-5", "openai"),
+        ("gpt-new-model", "openai"),
+        ("claude-new-model", "anthropic"),
+        ("claude-4-opus", "anthropic"),
+        ("glm-new-model", "anthropic"),
+        # Detection is case insensitive
+        ("GPT-4O", "openai"),
+        ("Claude-3-Opus", "anthropic"),
+        ("O1-MINI", "openai"),
+        ("GLM-4-PLUS", "anthropic"),
+        # Unknown models default to Anthropic (supports custom endpoints)
+        ("unknown-model", "anthropic"),
+        ("llama-2", "anthropic"),
+        ("mistral", "anthropic"),
+    ])
+    def test_detect(self, model, expected):
+        """Test detection of known, prefixed and unknown model names."""
+        assert detect_provider(model) == expected
+
+    @pytest.mark.parametrize("model,expected_provider", MODEL_PROVIDERS.items())
+    def test_model_provider_mapping_completeness(self, model, expected_provider):
         """Test that all models in the mapping are detected correctly."""
-        for model, expected_provider in MODEL_PROVIDERS.items():
-            assert detect_provider(model) == expected_provider
+        assert detect_provider(model) == expected_provider
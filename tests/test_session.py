@@ -1,9 +1,8 @@
 """Tests for session management."""
 
 import pytest
-import tempfile
-import os
 import json
+import os
 
 from mini_agent.session.storage import Session, SessionStorage
 from mini_agent.session.manager import SessionManager
@@ -26,6 +25,12 @@ class TestSession:
         assert session.model == "gpt-4"
         assert session.working_directory == "/tmp"
 
+    def test_model_names_are_shared(self):
+        first = Session(model="".join(["gpt-", "4o"]))
+        second = Session(model="".join(["gpt-", "4o"]))
+        assert first.model is second.model
+        assert not hasattr(first, "__dict__")
+
     def test_serialize(self):
         session = Session(
             id="test1234",
@@ -57,122 +62,172 @@ class TestSession:
 
 
 class TestSessionStorage:
-    def test_save_and_load(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-
-            session = Session(id="test1234", name="Test Session")
-            storage.save(session)
+    def test_save_and_load(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
 
-            # Check file exists
-            assert os.path.exists(os.path.join(tmpdir, "test1234.json"))
+        session = Session(id="test1234", name="Test Session")
+        storage.save(session)
 
-            # Load it back
-            loaded = storage.load("test1234")
-            assert loaded is not None
-            assert loaded.name == "Test Session"
+        # Check file exists
+        assert (tmp_path / "test1234.json").exists()
 
-    def test_load_nonexistent(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-            result = storage.load("nonexistent")
-            assert result is None
+        # Load it back
+        loaded = storage.load("test1234")
+        assert loaded is not None
+        assert loaded.name == "Test Session"
 
-    def test_delete(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
+    def test_load_null_model_and_provider(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        (tmp_path / "nullmodel.json").write_text(
+            json.dumps({"id": "nullmodel", "model": None, "provider": None})
+        )
 
-            session = Session(id="test1234", name="Test")
+        loaded = storage.load("nullmodel")
+        assert loaded is not None
+        assert loaded.model is None
+        assert loaded.provider is None
+
+    def test_load_nonexistent(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        result = storage.load("nonexistent")
+        assert result is None
+
+    def test_delete(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+
+        session = Session(id="test1234", name="Test")
+        storage.save(session)
+        assert storage.exists("test1234")
+
+        storage.delete("test1234")
+        assert not storage.exists("test1234")
+
+    def test_list_sessions(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+
+        # Create multiple sessions
+        storage.save(Session(id="session1", name="First"))
+        storage.save(Session(id="session2", name="Second"))
+        storage.save(Session(id="session3", name="Third"))
+
+        sessions = storage.list_sessions()
+        assert len(sessions) == 3
+
+        # Should be sorted by updated_at
+        ids = [s.id for s in sessions]
+        assert "session1" in ids
+        assert "session2" in ids
+        assert "session3" in ids
+
+    def test_list_sessions_reads_message_counts(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+
+        messages = [{"role": "user", "content": "hello"}] * 3
+        storage.save(Session(id="short", name="Short", messages=messages))
+        # Metadata longer than the part read for listing
+        storage.save(Session(id="long", name="x" * 10000, messages=messages[:1]))
+        # Saved before sessions recorded their message count
+        with open(tmp_path / "old.json", "w") as f:
+            json.dump({"id": "old", "name": "Old", "messages": messages[:2]}, f)
+
+        counts = {s.id: s.message_count for s in storage.list_sessions()}
+        assert counts == {"short": 3, "long": 1, "old": 2}
+
+    def test_list_sessions_newest_first(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        for session_id, mtime in [("session1", 1000), ("session2", 3000), ("session3", 2000)]:
+            storage.save(Session(id=session_id))
+            os.utime(tmp_path / f"{session_id}.json", (mtime, mtime))
+
+        assert [s.id for s in storage.list_sessions()] == ["session2", "session3", "session1"]
+
+    @pytest.mark.parametrize("serializer", ["json", "orjson", "compact"])
+    def test_list_sessions_parses_only_metadata(self, tmp_path, monkeypatch, serializer):
+        import mini_agent.session.storage as storage_module
+
+        if serializer == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(storage_module, "orjson", None)
+
+        storage = SessionStorage(base_dir=tmp_path)
+        session = Session(id="meta", name="Meta", messages=[{"role": "user", "content": "hello"}] * 2)
+        if serializer == "compact":
+            (tmp_path / "meta.json").write_text(json.dumps(session.to_dict(), separators=(",", ":")))
+        else:
             storage.save(session)
-            assert storage.exists("test1234")
-
-            storage.delete("test1234")
-            assert not storage.exists("test1234")
-
-    def test_list_sessions(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
 
-            # Create multiple sessions
-            storage.save(Session(id="session1", name="First"))
-            storage.save(Session(id="session2", name="Second"))
-            storage.save(Session(id="session3", name="Third"))
+        parsed = []
+        loads = storage_module._loads
+        monkeypatch.setattr(storage_module, "_loads", lambda raw: parsed.append(raw) or loads(raw))
 
-            sessions = storage.list_sessions()
-            assert len(sessions) == 3
-
-            # Should be sorted by updated_at
-            ids = [s.id for s in sessions]
-            assert "session1" in ids
-            assert "session2" in ids
-            assert "session3" in ids
+        [summary] = storage.list_sessions()
+        assert summary.id == "meta"
+        assert summary.name == "Meta"
+        assert summary.message_count == 2
+        assert parsed and not any(b"hello" in raw for raw in parsed)
 
 
 class TestSessionManager:
-    def test_create_session(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-            manager = SessionManager(storage=storage)
+    def test_create_session(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        manager = SessionManager(storage=storage)
 
-            session = manager.create_session(name="Test")
-            assert session.name == "Test"
-            assert manager.current_session == session
+        session = manager.create_session(name="Test")
+        assert session.name == "Test"
+        assert manager.current_session == session
 
-    def test_load_session(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-            manager = SessionManager(storage=storage)
+    def test_load_session(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        manager = SessionManager(storage=storage)
 
-            # Create and save
-            session = manager.create_session(name="Test")
+        # Create and save
+        session = manager.create_session(name="Test")
 
-            # Reset and load
-            manager.current_session = None
-            loaded = manager.load_session(session.id)
+        # Reset and load
+        manager.current_session = None
+        loaded = manager.load_session(session.id)
 
-            assert loaded is not None
-            assert loaded.name == "Test"
-            assert manager.current_session == loaded
+        assert loaded is not None
+        assert loaded.name == "Test"
+        assert manager.current_session == loaded
 
-    def test_get_or_create(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-            manager = SessionManager(storage=storage)
+    def test_get_or_create(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        manager = SessionManager(storage=storage)
 
-            # Should create new session
-            session1 = manager.get_or_create_session()
-            assert session1 is not None
+        # Should create new session
+        session1 = manager.get_or_create_session()
+        assert session1 is not None
 
-            # Should load existing
-            session2 = manager.get_or_create_session(session_id=session1.id)
-            assert session2.id == session1.id
+        # Should load existing
+        session2 = manager.get_or_create_session(session_id=session1.id)
+        assert session2.id == session1.id
 
-            # Should create new if ID doesn't exist
-            session3 = manager.get_or_create_session(session_id="nonexistent")
-            assert session3.id != session1.id
+        # Should create new if ID doesn't exist
+        session3 = manager.get_or_create_session(session_id="nonexistent")
+        assert session3.id != session1.id
 
-    def test_update_messages(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-            manager = SessionManager(storage=storage)
+    def test_update_messages(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        manager = SessionManager(storage=storage)
 
-            manager.create_session()
-            messages = [{"role": "user", "content": "hello"}]
-            manager.update_session_messages(messages)
+        manager.create_session()
+        messages = [{"role": "user", "content": "hello"}]
+        manager.update_session_messages(messages)
 
-            assert manager.current_session.messages == messages
+        assert manager.current_session.messages == messages
 
-    def test_get_session_info(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = SessionStorage(base_dir=tmpdir)
-            manager = SessionManager(storage=storage)
+    def test_get_session_info(self, tmp_path):
+        storage = SessionStorage(base_dir=tmp_path)
+        manager = SessionManager(storage=storage)
 
-            # No session yet
-            assert manager.get_session_info() is None
+        # No session yet
+        assert manager.get_session_info() is None
 
-            # Create session
-            manager.create_session(name="Test")
-            info = manager.get_session_info()
+        # Create session
+        manager.create_session(name="Test")
+        info = manager.get_session_info()
 
-            assert info is not None
-            assert info["name"] == "Test"
+        assert info is not None
+        assert info["name"] == "Test"
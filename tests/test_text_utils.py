@@ -4,6 +4,7 @@ import pytest
 from mini_agent.tools.text_utils import (
     strip_bom,
     detect_line_ending,
+    LINE_ENDING_SAMPLE_SIZE,
     normalize_to_lf,
     restore_line_endings,
     normalize_for_fuzzy_match,
@@ -69,6 +70,11 @@ class TestDetectLineEnding:
         """Empty content defaults to LF."""
         assert detect_line_ending("") == "\n"
 
+    def test_only_prefix_is_sampled(self):
+        """Line endings past the sample window are ignored."""
+        content = "x\n" * (LINE_ENDING_SAMPLE_SIZE // 2) + "y\r\n" * LINE_ENDING_SAMPLE_SIZE
+        assert detect_line_ending(content) == "\n"
+
 
 class TestNormalizeToLf:
     """Tests for line ending normalization."""
@@ -1,149 +1,179 @@
 """Tests for tools."""
 
 import pytest
-import tempfile
+import mmap
 import os
+import uuid
 from pathlib import Path
 
-from mini_agent.tools.truncate import truncate_head, truncate_tail
 from mini_agent.tools.read import ReadTool
 from mini_agent.tools.write import WriteTool
 from mini_agent.tools.edit import EditTool
 from mini_agent.tools.ls import ListTool
+from mini_agent.tools.grep import GrepTool
 
+# Text the read tests look for, as bytes to search the encoded tool output
+NEEDLES = {"hello": b"Hello", "world": b"World", "line2": b"Line 2"}
 
-class TestTruncate:
-    def test_truncate_tail_no_truncation(self):
-        content = "short content"
-        result = truncate_tail(content, max_lines=100, max_bytes=1000)
-        assert not result.was_truncated
-        assert result.content == content
-
-    def test_truncate_tail_by_lines(self):
-        lines = ["line " + str(i) for i in range(100)]
-        content = "\n".join(lines)
-        result = truncate_tail(content, max_lines=10)
-        assert result.was_truncated
-        assert result.lines_removed == 90
-        assert "line 0" in result.content
-        assert "line 99" not in result.content
-
-    def test_truncate_head_by_lines(self):
-        lines = ["line " + str(i) for i in range(100)]
-        content = "\n".join(lines)
-        result = truncate_head(content, max_lines=10)
-        assert result.was_truncated
-        assert result.lines_removed == 90
-        assert "line 99" in result.content
-        assert "line 0" not in result.content
-
-    def test_truncate_empty_content(self):
-        result = truncate_tail("", max_lines=10)
-        assert result.content == ""
-        assert not result.was_truncated
-
-    def test_truncate_by_bytes(self):
-        content = "x" * 1000
-        result = truncate_tail(content, max_lines=1000, max_bytes=100)
-        assert result.was_truncated
-        assert len(result.content.encode('utf-8')) <= 150
 
+def assert_file_content(path, expected: bytes) -> None:
+    """Assert that a file holds exactly expected, scanning it through mmap."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        assert size == len(expected)
+        if size:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                assert mm.find(expected) == 0
+    finally:
+        os.close(fd)
 
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestReadTool:
-    @pytest.mark.asyncio
-    async def test_read_file(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Hello\nWorld\n")
-            f.flush()
-            temp_path = f.name
+    async def test_read_file(self, fast_tmpfile):
+        temp_path = fast_tmpfile("Hello\nWorld\n")
 
-        try:
-            tool = ReadTool()
-            result = await tool.execute({"file_path": temp_path})
-            assert "Hello" in result
-            assert "World" in result
-        finally:
-            os.unlink(temp_path)
+        tool = ReadTool()
+        result = await tool.execute({"file_path": temp_path})
+        buf = result.encode()
+        assert NEEDLES["hello"] in buf
+        assert NEEDLES["world"] in buf
 
-    @pytest.mark.asyncio
     async def test_read_nonexistent_file(self):
         tool = ReadTool()
         result = await tool.execute({"file_path": "/nonexistent/file.txt"})
         assert "Error" in result
 
-    @pytest.mark.asyncio
-    async def test_read_with_offset(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Line 1\nLine 2\nLine 3\n")
-            f.flush()
-            temp_path = f.name
+    async def test_read_with_offset(self, fast_tmpfile):
+        temp_path = fast_tmpfile("Line 1\nLine 2\nLine 3\n")
 
-        try:
-            tool = ReadTool()
-            result = await tool.execute({"file_path": temp_path, "offset": 2})
-            assert "Line 2" in result
-            # Line 1 should not appear (offset starts from line 2)
-        finally:
-            os.unlink(temp_path)
+        tool = ReadTool()
+        result = await tool.execute({"file_path": temp_path, "offset": 2})
+        assert NEEDLES["line2"] in result.encode()
+        # Line 1 should not appear (offset starts from line 2)
+
+    async def test_read_large_file_mmap(self, monkeypatch, fast_tmpfile):
+        import mini_agent.tools.read as read_module
+        monkeypatch.setattr(read_module, "_MMAP_THRESHOLD", 0)
+
+        temp_path = fast_tmpfile("".join(f"Line {i}\n" for i in range(1, 11)))
+
+        tool = ReadTool()
+        result = await tool.execute({"file_path": temp_path, "offset": 3, "limit": 2})
+        assert "     3\tLine 3" in result
+        assert "     4\tLine 4" in result
+        assert "Line 5" not in result
+        assert "File has 10 total lines" in result
+
+    @pytest.mark.parametrize("data", [
+        b"a\r\nb\rc\nd\r\re\r\nf",
+        b"caf\xc3\xa9\r\nb\rc\nd\n\r\n\r",
+    ])
+    @pytest.mark.parametrize("offset, limit", [(1, 2000), (2, 3), (5, 1), (9, 2)])
+    @pytest.mark.parametrize("chunk_size", [1, 4])
+    async def test_read_large_file_mmap_matches_small_file(
+        self, monkeypatch, fast_tmp, data, offset, limit, chunk_size
+    ):
+        import mini_agent.tools.read as read_module
+
+        temp_path = fast_tmp / f"{uuid.uuid4().hex}.txt"
+        temp_path.write_bytes(data)
+        arguments = {"file_path": str(temp_path), "offset": offset, "limit": limit}
+
+        tool = ReadTool()
+        expected = await tool.execute(arguments)
+
+        # Small chunks also split \r\n pairs across chunk boundaries
+        monkeypatch.setattr(read_module, "_MMAP_THRESHOLD", 0)
+        monkeypatch.setattr(read_module, "_COUNT_CHUNK_SIZE", chunk_size)
+        assert await tool.execute(arguments) == expected
+
+    async def test_read_large_file_mmap_decodes_window(self, monkeypatch, fast_tmpfile):
+        import mini_agent.tools.read as read_module
+        monkeypatch.setattr(read_module, "_MMAP_THRESHOLD", 0)
+
+        # Only the lines returned decide the encoding
+        temp_path = fast_tmpfile("café\nplain\n")
+        with open(temp_path, "ab") as f:
+            f.write(b"\xff\n")
+
+        tool = ReadTool()
+        assert "     1\tcafé" in await tool.execute({"file_path": temp_path, "limit": 1})
+        assert "     3\t\xff" in await tool.execute({"file_path": temp_path, "offset": 3})
 
-    @pytest.mark.asyncio
     async def test_read_requires_absolute_path(self):
         tool = ReadTool()
         result = await tool.execute({"file_path": "relative/path.txt"})
         assert "must be absolute" in result
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestWriteTool:
-    @pytest.mark.asyncio
-    async def test_write_new_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_path = os.path.join(tmpdir, "test.txt")
-
-            tool = WriteTool()
-            result = await tool.execute({
-                "file_path": file_path,
-                "content": "Hello World"
-            })
-
-            assert "Created" in result
-            assert os.path.exists(file_path)
-
-            with open(file_path) as f:
-                assert f.read() == "Hello World"
-
-    @pytest.mark.asyncio
-    async def test_write_creates_directories(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_path = os.path.join(tmpdir, "subdir", "nested", "test.txt")
-
-            tool = WriteTool()
-            result = await tool.execute({
-                "file_path": file_path,
-                "content": "Nested content"
-            })
-
-            assert os.path.exists(file_path)
-
-    @pytest.mark.asyncio
-    async def test_overwrite_existing(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            file_path = os.path.join(tmpdir, "test.txt")
-
-            # Create initial file
-            with open(file_path, 'w') as f:
-                f.write("Original")
-
-            tool = WriteTool()
-            result = await tool.execute({
-                "file_path": file_path,
-                "content": "New content"
-            })
-
-            assert "Updated" in result
-            with open(file_path) as f:
-                assert f.read() == "New content"
-
-    @pytest.mark.asyncio
+    async def test_write_new_file(self, fast_tmp):
+        tmpdir = fast_tmp / uuid.uuid4().hex
+        tmpdir.mkdir()
+        file_path = os.path.join(tmpdir, "test.txt")
+
+        tool = WriteTool()
+        result = await tool.execute({
+            "file_path": file_path,
+            "content": "Hello World"
+        })
+
+        assert "Created" in result
+        assert os.path.exists(file_path)
+
+        with open(file_path) as f:
+            assert f.read() == "Hello World"
+
+    async def test_write_creates_directories(self, fast_tmp):
+        tmpdir = fast_tmp / uuid.uuid4().hex
+        tmpdir.mkdir()
+        file_path = os.path.join(tmpdir, "subdir", "nested", "test.txt")
+
+        tool = WriteTool()
+        result = await tool.execute({
+            "file_path": file_path,
+            "content": "Nested content"
+        })
+
+        assert os.path.exists(file_path)
+
+    async def test_overwrite_existing(self, fast_tmp):
+        tmpdir = fast_tmp / uuid.uuid4().hex
+        tmpdir.mkdir()
+        file_path = os.path.join(tmpdir, "test.txt")
+
+        # Create initial file
+        with open(file_path, 'w') as f:
+            f.write("Original")
+
+        tool = WriteTool()
+        result = await tool.execute({
+            "file_path": file_path,
+            "content": "New content"
+        })
+
+        assert "Updated" in result
+        assert_file_content(file_path, b"New content")
+
+    async def test_write_utf8_content(self, fast_tmp):
+        tmpdir = fast_tmp / uuid.uuid4().hex
+        tmpdir.mkdir()
+        file_path = os.path.join(tmpdir, "test.txt")
+
+        tool = WriteTool()
+        result = await tool.execute({
+            "file_path": file_path,
+            "content": "héllo\nwörld\n"
+        })
+
+        assert "Lines: 3" in result
+        assert "Bytes: 14" in result
+        with open(file_path, 'rb') as f:
+            assert f.read() == "héllo\nwörld\n".encode('utf-8')
+
     async def test_write_requires_absolute_path(self):
         tool = WriteTool()
         result = await tool.execute({
@@ -153,113 +183,174 @@ class TestWriteTool:
         assert "must be absolute" in result
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestEditTool:
-    @pytest.mark.asyncio
-    async def test_edit_replace(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Hello World\nGoodbye World")
-            f.flush()
-            temp_path = f.name
+    async def test_edit_replace(self, fast_tmpfile):
+        temp_path = fast_tmpfile("Hello World\nGoodbye World")
 
-        try:
-            tool = EditTool()
-            result = await tool.execute({
-                "file_path": temp_path,
-                "old_string": "World",
-                "new_string": "Universe",
-                "replace_all": True
-            })
-
-            assert "Replaced 2" in result
-
-            with open(temp_path) as f:
-                content = f.read()
-            assert content == "Hello Universe\nGoodbye Universe"
-        finally:
-            os.unlink(temp_path)
+        tool = EditTool()
+        result = await tool.execute({
+            "file_path": temp_path,
+            "old_string": "World",
+            "new_string": "Universe",
+            "replace_all": True
+        })
 
-    @pytest.mark.asyncio
-    async def test_edit_single_occurrence(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Hello World")
-            f.flush()
-            temp_path = f.name
+        assert "Replaced 2" in result
+        assert_file_content(temp_path, b"Hello Universe\nGoodbye Universe")
 
-        try:
-            tool = EditTool()
-            result = await tool.execute({
-                "file_path": temp_path,
-                "old_string": "World",
-                "new_string": "Universe"
-            })
-
-            assert "Replaced 1" in result
-        finally:
-            os.unlink(temp_path)
+    async def test_edit_single_occurrence(self, fast_tmpfile):
+        temp_path = fast_tmpfile("Hello World")
+
+        tool = EditTool()
+        result = await tool.execute({
+            "file_path": temp_path,
+            "old_string": "World",
+            "new_string": "Universe"
+        })
 
-    @pytest.mark.asyncio
-    async def test_edit_multiple_without_replace_all(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Hello World\nHello World")
-            f.flush()
-            temp_path = f.name
+        assert "Replaced 1" in result
+        assert_file_content(temp_path, b"Hello Universe")
 
-        try:
-            tool = EditTool()
-            result = await tool.execute({
-                "file_path": temp_path,
-                "old_string": "World",
-                "new_string": "Universe"
-            })
-
-            assert "appears 2 times" in result
-        finally:
-            os.unlink(temp_path)
+    async def test_edit_multiple_without_replace_all(self, fast_tmpfile):
+        temp_path = fast_tmpfile("Hello World\nHello World")
+
+        tool = EditTool()
+        result = await tool.execute({
+            "file_path": temp_path,
+            "old_string": "World",
+            "new_string": "Universe"
+        })
 
-    @pytest.mark.asyncio
-    async def test_edit_not_found(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Hello World")
-            f.flush()
-            temp_path = f.name
+        assert "appears 2 times" in result
 
-        try:
-            tool = EditTool()
-            result = await tool.execute({
-                "file_path": temp_path,
-                "old_string": "NotExist",
-                "new_string": "Something"
-            })
-
-            assert "not found" in result
-        finally:
-            os.unlink(temp_path)
+    async def test_edit_not_found(self, fast_tmpfile):
+        temp_path = fast_tmpfile("Hello World")
+
+        tool = EditTool()
+        result = await tool.execute({
+            "file_path": temp_path,
+            "old_string": "NotExist",
+            "new_string": "Something"
+        })
+
+        assert "not found" in result
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestListTool:
-    @pytest.mark.asyncio
-    async def test_list_directory(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create some files
-            Path(tmpdir, "file1.txt").touch()
-            Path(tmpdir, "file2.txt").touch()
-            os.mkdir(Path(tmpdir, "subdir"))
-
-            tool = ListTool()
-            result = await tool.execute({"path": tmpdir})
-
-            assert "file1.txt" in result
-            assert "file2.txt" in result
-            assert "subdir" in result
-
-    @pytest.mark.asyncio
+    async def test_list_directory(self, list_fixture_dir):
+        tool = ListTool()
+        result = await tool.execute({"path": list_fixture_dir})
+
+        assert "file1.txt" in result
+        assert "file2.txt" in result
+        assert "subdir" in result
+
     async def test_list_requires_absolute_path(self):
         tool = ListTool()
         result = await tool.execute({"path": "relative/path"})
         assert "must be absolute" in result
 
-    @pytest.mark.asyncio
     async def test_list_nonexistent(self):
         tool = ListTool()
         result = await tool.execute({"path": "/nonexistent/directory"})
         assert "not found" in result or "Error" in result
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestGrepFallback:
+    @pytest.fixture
+    def grep_dir(self, fast_tmp):
+        grep_dir = fast_tmp / uuid.uuid4().hex
+        grep_dir.mkdir()
+        return str(grep_dir)
+
+    async def test_fallback_grep(self, grep_dir):
+        Path(grep_dir, "a.py").write_text("def foo():\n    return 1\n")
+        Path(grep_dir, "b.txt").write_text("foo bar\n")
+
+        tool = GrepTool()
+        result = await tool._fallback_grep({"pattern": "foo", "path": grep_dir})
+
+        assert "a.py:1:" in result
+        assert "b.txt:1:" in result
+
+    async def test_fallback_grep_line_numbers(self, grep_dir):
+        Path(grep_dir, "a.txt").write_text("foo foo\nbar\n\nfoo\n")
+
+        tool = GrepTool()
+        result = await tool._fallback_grep({"pattern": "foo", "path": grep_dir})
+        assert result.splitlines() == [
+            f"{Path(grep_dir, 'a.txt')}:1:\tfoo foo",
+            f"{Path(grep_dir, 'a.txt')}:4:\tfoo",
+        ]
+
+        result = await tool._fallback_grep({"pattern": "^$", "path": grep_dir})
+        assert result == f"{Path(grep_dir, 'a.txt')}:3:\t"
+
+    @pytest.mark.parametrize("pattern, expected", [
+        ("[^z]+z", [3]),
+        (r"foo\s+bar", []),
+        ("o\n", []),
+        (r"o\s*$", [1]),
+    ])
+    async def test_fallback_grep_does_not_match_across_lines(self, grep_dir, pattern, expected):
+        Path(grep_dir, "a.txt").write_text("foo\nbar\nbaz qux\n")
+
+        tool = GrepTool()
+        result = await tool._fallback_grep({"pattern": pattern, "path": grep_dir})
+        if expected:
+            assert [int(line.split(":")[1]) for line in result.splitlines()] == expected
+        else:
+            assert result == "No matches found"
+
+    async def test_fallback_grep_glob(self, grep_dir):
+        Path(grep_dir, "a.py").write_text("foo\n")
+        Path(grep_dir, "b.txt").write_text("foo\n")
+
+        tool = GrepTool()
+        result = await tool._fallback_grep({
+            "pattern": "foo",
+            "path": grep_dir,
+            "glob": "*.py",
+        })
+
+        assert "a.py" in result
+        assert "b.txt" not in result
+
+    async def test_fallback_grep_no_matches(self, grep_dir):
+        Path(grep_dir, "a.py").write_text("bar\n")
+
+        tool = GrepTool()
+        result = await tool._fallback_grep({"pattern": "foo", "path": grep_dir})
+
+        assert result == "No matches found"
+
+    @pytest.mark.parametrize("pattern, case_insensitive", [
+        ("foo", False),
+        ("FOO", True),
+        ("^$", False),
+        (r"\bba\w", False),
+        (r"[ao]z?\s*$", False),
+        (r"(o)\1", False),
+    ])
+    async def test_fallback_grep_re2_matches_re(self, grep_dir, monkeypatch, pattern, case_insensitive):
+        pytest.importorskip("re2")
+        import mini_agent.tools.grep as grep_module
+
+        Path(grep_dir, "a.txt").write_text("foo\nbar\n\nbaz qux\nFoo boo\n")
+        arguments = {"pattern": pattern, "path": grep_dir, "case_insensitive": case_insensitive}
+        tool = GrepTool()
+
+        grep_module._compile_pattern.cache_clear()
+        with_re2 = await tool._fallback_grep(arguments)
+
+        monkeypatch.setattr(grep_module, "re2", None)
+        grep_module._compile_pattern.cache_clear()
+        try:
+            with_re = await tool._fallback_grep(arguments)
+        finally:
+            grep_module._compile_pattern.cache_clear()
+
+        assert with_re2 == with_re
@@ -39,6 +39,13 @@ class TestTextContent:
         assert content.text == ""
         assert content.type == "text"
 
+    def test_deserialize_empty_is_not_shared(self):
+        first = TextContent.from_dict({"text": "", "type": "text"})
+        first.text = "changed"
+        second = TextContent.from_dict({"text": "", "type": "text"})
+        assert second is not first
+        assert second.text == ""
+
 
 class TestThinkingContent:
     def test_create(self):
@@ -157,6 +164,12 @@ class TestAssistantMessage:
         ])
         assert msg.text == "Hello World"
 
+    def test_text_follows_content(self):
+        msg = AssistantMessage()
+        assert msg.text == ""
+        msg.content.append(TextContent(text="hi"))
+        assert msg.text == "hi"
+
     def test_tool_calls_property(self):
         msg = AssistantMessage(content=[
             TextContent(text="Result"),
@@ -194,6 +207,15 @@ class TestAssistantMessage:
         assert msg.stop_reason == StopReason.TOOL_USE
         assert msg.usage.input_tokens == 10
 
+    @pytest.mark.parametrize("stop_reason", [None, "unknown", ["tool_use"], {"a": 1}])
+    def test_deserialize_invalid_stop_reason(self, stop_reason):
+        msg = AssistantMessage.from_dict({"content": [], "stop_reason": stop_reason})
+        assert msg.stop_reason == StopReason.END_TURN
+
+    def test_deserialize_stop_reason_member(self):
+        msg = AssistantMessage.from_dict({"content": [], "stop_reason": StopReason.TOOL_USE})
+        assert msg.stop_reason is StopReason.TOOL_USE
+
 
 class TestToolResultMessage:
     def test_create(self):
@@ -221,6 +243,16 @@ class TestToolResultMessage:
         assert msg.is_error
 
 
+@pytest.fixture(scope="module")
+def ctx_sample():
+    """A small context and its to_dict() output, built once for the module."""
+    ctx = Context()
+    ctx.system_prompt = "Be helpful"
+    ctx.add_user_message("Hello")
+    ctx.add_tool_result("call_123", "result")
+    return ctx, ctx.to_dict()
+
+
 class TestContext:
     def test_empty(self):
         ctx = Context()
@@ -260,13 +292,13 @@ class TestContext:
         assert len(ctx.messages) == 2
         assert len(ctx_copy.messages) == 1
 
-    def test_serialize_deserialize(self):
-        ctx = Context()
-        ctx.system_prompt = "Be helpful"
-        ctx.add_user_message("Hello")
-        ctx.add_tool_result("call_123", "result")
+    def test_serialize(self, ctx_sample):
+        _, data = ctx_sample
+        assert data["system_prompt"] == "Be helpful"
+        assert len(data["messages"]) == 2
 
-        data = ctx.to_dict()
+    def test_serialize_deserialize(self, ctx_sample):
+        _, data = ctx_sample
         ctx2 = Context.from_dict(data)
 
         assert len(ctx2.messages) == 2